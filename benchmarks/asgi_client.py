@@ -0,0 +1,74 @@
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+
+class ASGIClient:
+    """Minimal in-process HTTP client that calls an ASGI app directly.
+
+    Keeps the benchmark free of extra dependencies and of socket overhead, so
+    the numbers reflect the application itself.
+    """
+
+    def __init__(self, app, client_host: str = "127.0.0.1"):
+        self.app = app
+        self.client_host = client_host
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json_body=None,
+        headers: dict | None = None,
+    ) -> tuple[int, bytes]:
+        url = urlsplit(path)
+        body = json.dumps(json_body).encode() if json_body is not None else b""
+
+        raw_headers = [(b"host", b"benchmark")]
+        if json_body is not None:
+            raw_headers.append((b"content-type", b"application/json"))
+        raw_headers.append((b"content-length", str(len(body)).encode()))
+        for name, value in (headers or {}).items():
+            raw_headers.append((name.lower().encode(), value.encode()))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": url.path,
+            "raw_path": url.path.encode(),
+            "query_string": url.query.encode(),
+            "root_path": "",
+            "headers": raw_headers,
+            "client": (self.client_host, 50000),
+            "server": ("benchmark", 80),
+        }
+
+        request_sent = False
+        response_complete = asyncio.Event()
+        status = 0
+        chunks: list[bytes] = []
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        await self.app(scope, receive, send)
+        response_complete.set()
+
+        return status, b"".join(chunks)
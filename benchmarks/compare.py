@@ -0,0 +1,42 @@
+"""Compare two load_test result files.
+
+Usage: python -m benchmarks.compare <baseline.json> <candidate.json>
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+METRICS = ["throughput_rps", "p50_ms", "p95_ms", "p99_ms"]
+
+
+def change(baseline: float, candidate: float) -> str:
+    if not baseline:
+        return "n/a"
+    return f"{(candidate - baseline) / baseline:+.1%}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    print(f"baseline {baseline['commit']} -> candidate {candidate['commit']}")
+
+    for scenario, result in candidate["results"].items():
+        base = baseline["results"].get(scenario)
+        if base is None:
+            continue
+        cells = [
+            f"{metric} {base[metric]:.1f} -> {result[metric]:.1f} "
+            f"({change(base[metric], result[metric])})"
+            for metric in METRICS
+        ]
+        print(f"{scenario:>15}: " + ", ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Measure event-loop latency while bcrypt password checks run concurrently.
+
+A probe coroutine sleeps for 1 ms in a loop and records how late it wakes up,
+which is the delay every other request on the worker would see. It runs once
+per hashing mode while `--logins` verifications are in flight:
+
+    python -m benchmarks.event_loop --logins 32 --modes inline thread process
+
+`inline` calls bcrypt directly in the coroutine, as login did before the hash
+pool existed; `thread` and `process` go through HashExecutor.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+
+from benchmarks.load_test import RESULTS_DIR, git_commit
+
+MODES = ["inline", "thread", "process"]
+PROBE_INTERVAL = 0.001
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def probe(stop: asyncio.Event, lags: list[float]):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def run_mode(mode: str, logins: int, workers: int, password_hash: str) -> dict:
+    from src.auth.hash import (
+        Hash,
+        HashExecutor,
+        _verify_and_update,
+        bcrypt_rounds,
+    )
+
+    executor = None
+    if mode == "inline":
+
+        async def verify():
+            return Hash().verify_password("benchmark-password", password_hash)
+
+    else:
+        executor = HashExecutor(mode, workers, workers)
+        rounds, min_rounds = bcrypt_rounds()
+
+        async def verify():
+            return await executor.run(
+                _verify_and_update,
+                "benchmark-password",
+                password_hash,
+                rounds,
+                min_rounds,
+            )
+
+        # Start the pool outside the measured window.
+        await verify()
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe_task = asyncio.create_task(probe(stop, lags))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe_task
+    if executor is not None:
+        executor.shutdown()
+
+    lags.sort()
+    return {
+        "logins": logins,
+        "elapsed_s": elapsed,
+        "logins_per_s": logins / elapsed,
+        "probe_samples": len(lags),
+        "lag_p50_ms": percentile(lags, 0.50) * 1000,
+        "lag_p99_ms": percentile(lags, 0.99) * 1000,
+        "lag_max_ms": percentile(lags, 1.0) * 1000,
+    }
+
+
+async def run(args) -> dict:
+    from src.auth.hash import Hash
+
+    password_hash = Hash().get_password_hash("benchmark-password")
+    results = {}
+    for mode in args.modes:
+        results[mode] = await run_mode(mode, args.logins, args.workers, password_hash)
+        print(f"{mode:>8}: {json.dumps(results[mode])}")
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {"logins": args.logins, "workers": args.workers},
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now(UTC):%Y%m%dT%H%M%S}-event-loop-{report['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Drive the API in-process with concurrent clients and record latency stats.
+
+Seed the database first (python -m benchmarks.seed), then run:
+
+    python -m benchmarks.load_test --requests 2000 --concurrency 32
+
+Results are written as JSON to benchmarks/results/ and can be compared with
+python -m benchmarks.compare <baseline.json> <candidate.json>.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import time
+import uuid
+from datetime import datetime, UTC
+from pathlib import Path
+
+from benchmarks.asgi_client import ASGIClient
+from benchmarks.seed import BENCH_PASSWORD, bench_email, seed
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SCENARIOS = ["signup", "login", "me", "list", "search", "soon_celebrate"]
+
+
+def configure_environment(args):
+    # Settings are read at import time, so these must be set before importing main.
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ["EMAIL_WORKER_ENABLED"] = "false"
+    os.environ["RESPONSE_CACHE_ENABLED"] = "true" if args.response_cache else "false"
+
+
+def build_scenarios(client: ASGIClient, token: str, args) -> dict:
+    auth = {"Authorization": f"Bearer {token}"}
+    run_id = uuid.uuid4().hex[:8]
+
+    async def signup(i):
+        return await client.request(
+            "POST",
+            "/api/contacts/signup",
+            json_body={
+                "first_name": "Load",
+                "last_name": "Test",
+                "email": f"signup-{run_id}-{i}@example.com",
+                "phone": "380000000000",
+                "birth_day": "1990-01-01",
+                "password": BENCH_PASSWORD,
+            },
+        )
+
+    async def login(i):
+        return await client.request(
+            "POST",
+            "/api/auth/login",
+            json_body={
+                "email": bench_email(i % args.login_accounts),
+                "password": BENCH_PASSWORD,
+            },
+        )
+
+    async def me(i):
+        return await client.request("GET", "/api/contacts/me", headers=auth)
+
+    async def list_contacts(i):
+        skip = (i * args.page_size) % max(args.contacts - args.page_size, 1)
+        return await client.request(
+            "GET", f"/api/contacts/?skip={skip}&limit={args.page_size}"
+        )
+
+    async def search(i):
+        query = ["Ann", "Bond", "Kova", "Mel", "Olen", "Tara"][i % 6]
+        return await client.request("GET", f"/api/contacts/search?q={query}")
+
+    async def soon_celebrate(i):
+        return await client.request("GET", "/api/contacts/soon_celebrate?days=7")
+
+    return {
+        "signup": signup,
+        "login": login,
+        "me": me,
+        "list": list_contacts,
+        "search": search,
+        "soon_celebrate": soon_celebrate,
+    }
+
+
+async def run_scenario(scenario, requests: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            status, _ = await scenario(i)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentiles[49] * 1000 if percentiles else 0.0,
+        "p95_ms": percentiles[94] * 1000 if percentiles else 0.0,
+        "p99_ms": percentiles[98] * 1000 if percentiles else 0.0,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(args) -> dict:
+    from main import app
+
+    if args.seed:
+        await seed(args.contacts)
+
+    async with app.router.lifespan_context(app):
+        client = ASGIClient(app)
+        status, body = await client.request(
+            "POST",
+            "/api/auth/login",
+            json_body={"email": bench_email(0), "password": BENCH_PASSWORD},
+        )
+        if status != 200:
+            raise SystemExit(f"Login failed ({status}): seed the database first")
+        token = json.loads(body)["access_token"]
+
+        scenarios = build_scenarios(client, token, args)
+        results = {}
+        for name in args.scenarios:
+            requests = args.requests
+            # bcrypt-bound flows are orders of magnitude slower than reads.
+            if name in ("signup", "login"):
+                requests = max(args.requests // 10, 1)
+            results[name] = await run_scenario(
+                scenarios[name], requests, args.concurrency
+            )
+            print(f"{name:>15}: {json.dumps(results[name])}")
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {
+            "contacts": args.contacts,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "page_size": args.page_size,
+            "response_cache": args.response_cache,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--contacts", type=int, default=10000)
+    parser.add_argument("--seed", action="store_true", help="seed before running")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--login-accounts", type=int, default=100)
+    parser.add_argument("--response-cache", action="store_true")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    configure_environment(args)
+    report = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now(UTC):%Y%m%dT%H%M%S}-{report['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Compare deep-page latency of offset and cursor pagination on GET /api/contacts/.
+
+Seed the database first (python -m benchmarks.seed --contacts 100000), then run:
+
+    python -m benchmarks.pagination --page 1000 --page-size 50
+
+Both modes fetch the same page; the cursor for it is looked up once, untimed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+
+from benchmarks.asgi_client import ASGIClient
+from benchmarks.load_test import RESULTS_DIR, git_commit
+
+
+async def page_cursor(page: int, page_size: int) -> str:
+    """Cursor that starts at `page` (zero-based), i.e. after its previous row."""
+    from sqlalchemy import select
+
+    from src.database.db import sessionmanager
+    from src.database.models.contacts_model import Contact
+    from src.features.contacts.cursor import encode_cursor
+
+    if page == 0:
+        return ""
+
+    async with sessionmanager.session() as session:
+        stmt = (
+            select(Contact.id)
+            .order_by(Contact.id)
+            .offset(page * page_size - 1)
+            .limit(1)
+        )
+        last_id = (await session.execute(stmt)).scalar_one_or_none()
+
+    if last_id is None:
+        raise SystemExit(f"Page {page} does not exist: seed more contacts")
+
+    return encode_cursor(last_id)
+
+
+async def measure(client: ASGIClient, path: str, repeat: int) -> dict:
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        status, _ = await client.request("GET", path)
+        latencies.append(time.perf_counter() - start)
+        if status != 200:
+            raise SystemExit(f"GET {path} failed with {status}")
+
+    return {
+        "requests": repeat,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "min_ms": min(latencies) * 1000,
+    }
+
+
+async def run(args) -> dict:
+    from main import app
+
+    async with app.router.lifespan_context(app):
+        client = ASGIClient(app)
+        cursor = await page_cursor(args.page, args.page_size)
+        offset_path = (
+            f"/api/contacts/?skip={args.page * args.page_size}&limit={args.page_size}"
+        )
+        cursor_path = f"/api/contacts/?cursor={cursor}&limit={args.page_size}"
+
+        # Warm the connection pool and statement cache before timing.
+        await measure(client, offset_path, 3)
+        await measure(client, cursor_path, 3)
+
+        results = {
+            "offset": await measure(client, offset_path, args.repeat),
+            "cursor": await measure(client, cursor_path, args.repeat),
+        }
+
+    for mode, result in results.items():
+        print(f"{mode:>7}: {json.dumps(result)}")
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {
+            "page": args.page,
+            "page_size": args.page_size,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ["EMAIL_WORKER_ENABLED"] = "false"
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    report = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now(UTC):%Y%m%dT%H%M%S}-pagination-{report['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
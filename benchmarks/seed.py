@@ -0,0 +1,75 @@
+"""Seed the configured database with benchmark contacts.
+
+Usage: python -m benchmarks.seed --contacts 100000
+"""
+
+import argparse
+import asyncio
+import random
+from datetime import date, timedelta
+
+BENCH_PASSWORD = "benchmark-password"
+FIRST_NAMES = [
+    "Anna",
+    "Bohdan",
+    "Daria",
+    "Ihor",
+    "Kateryna",
+    "Maksym",
+    "Olena",
+    "Taras",
+]
+LAST_NAMES = ["Bondar", "Kovalenko", "Melnyk", "Shevchenko", "Tkachenko", "Zhuk"]
+
+
+def bench_email(index: int) -> str:
+    return f"bench-{index}@example.com"
+
+
+def contact_row(index: int, password_hash: str, rng: random.Random) -> dict:
+    return {
+        "first_name": rng.choice(FIRST_NAMES),
+        "last_name": rng.choice(LAST_NAMES),
+        "email": bench_email(index),
+        "phone": f"380{index:09d}"[-12:],
+        "birth_day": date(1970, 1, 1) + timedelta(days=rng.randrange(365 * 40)),
+        "avatar": None,
+        "data": {"company": rng.choice(["Acme", "Globex", "Initech"])},
+        "password": password_hash,
+        "verified": True,
+    }
+
+
+async def seed(contacts: int, batch_size: int = 1000, seed_value: int = 42) -> int:
+    from src.auth.contacts_repository import ContactsRepository
+    from src.auth.hash import Hash
+    from src.database.db import sessionmanager
+
+    rng = random.Random(seed_value)
+    password_hash = Hash().get_password_hash(BENCH_PASSWORD)
+    inserted = 0
+
+    async with sessionmanager.session() as session:
+        repository = ContactsRepository(session)
+        for start in range(0, contacts, batch_size):
+            rows = [
+                contact_row(index, password_hash, rng)
+                for index in range(start, min(start + batch_size, contacts))
+            ]
+            inserted += len(await repository.create_contacts_bulk(rows))
+
+    return inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contacts", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    inserted = asyncio.run(seed(args.contacts, args.batch_size))
+    print(f"Inserted {inserted} contacts ({args.contacts - inserted} already present)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare rows/sec of the contact list serializers, without a database.
+
+    python -m benchmarks.serializer --rows 1000 --repeat 50
+
+`pydantic` validates every row into ContactResponseModel and dumps the list, as
+the list routes did before contacts_serializer; `json` and `orjson` are the two
+backends of contacts_serializer.dumps. orjson is skipped when not installed.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import date, datetime, UTC
+from pathlib import Path
+
+from benchmarks.load_test import RESULTS_DIR, git_commit
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {
+            "id": index,
+            "first_name": f"First{index}",
+            "last_name": f"Last{index}",
+            "email": f"contact{index}@example.com",
+            "phone": f"38050{index:07d}"[:12],
+            "birth_day": date(1990, 1 + index % 12, 1 + index % 28),
+            "avatar": f"https://www.gravatar.com/avatar/{index:032x}",
+            "data": {"company": "Example", "tags": ["friend", "work"], "score": index},
+        }
+        for index in range(count)
+    ]
+
+
+def serializers() -> dict:
+    from pydantic import TypeAdapter
+
+    from src.features.contacts import contacts_serializer
+    from src.features.contacts.schema.contact_response_schema import (
+        ContactResponseModel,
+    )
+
+    adapter = TypeAdapter(list[ContactResponseModel])
+    orjson = contacts_serializer.orjson
+
+    def stdlib(rows):
+        contacts_serializer.orjson = None
+        try:
+            return contacts_serializer.dumps(rows)
+        finally:
+            contacts_serializer.orjson = orjson
+
+    modes = {
+        "pydantic": lambda rows: adapter.dump_json(adapter.validate_python(rows)),
+        "json": stdlib,
+    }
+    if orjson is not None:
+        modes["orjson"] = contacts_serializer.dumps
+    return modes
+
+
+def measure(serialize, rows: list[dict], repeat: int) -> dict:
+    serialize(rows)  # warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        serialize(rows)
+        timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    return {
+        "rows": len(rows),
+        "repeat": repeat,
+        "median_ms": median * 1000,
+        "rows_per_s": len(rows) / median,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    results = {}
+    for mode, serialize in serializers().items():
+        results[mode] = measure(serialize, rows, args.repeat)
+        print(f"{mode:>8}: {json.dumps(results[mode])}")
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {"rows": args.rows, "repeat": args.repeat},
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now(UTC):%Y%m%dT%H%M%S}-serializer-{report['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Microbenchmark JWT decode/verify as done by get_current_user.
+
+    python -m benchmarks.tokens --tokens 1000 --repeat 5
+
+`cold` verifies every token's signature (empty VerifiedTokenCache), `cached`
+decodes the same tokens again from the cache, and `invalid` measures rejection
+of tokens with a bad signature, the path unauthenticated abuse takes.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+
+from benchmarks.load_test import RESULTS_DIR, git_commit
+
+
+def measure(decode, tokens: list[str], repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for token in tokens:
+            decode(token)
+        timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    return {
+        "tokens": len(tokens),
+        "repeat": repeat,
+        "median_us_per_token": median / len(tokens) * 1_000_000,
+        "tokens_per_s": len(tokens) / median,
+    }
+
+
+def run(args) -> dict:
+    from jose import JWTError
+
+    from src.auth import tokens as token_module
+
+    access_tokens = [
+        token_module.create_access_token({"sub": f"user{index}@example.com"})
+        for index in range(args.tokens)
+    ]
+    invalid_tokens = [token[:-4] + "AAAA" for token in access_tokens]
+
+    def cold(token):
+        token_module.token_cache._items.pop(token, None)
+        token_module.decode_token(token)
+
+    def rejected(token):
+        try:
+            token_module.decode_token(token)
+        except JWTError:
+            pass
+
+    results = {"cold": measure(cold, access_tokens, args.repeat)}
+    for token in access_tokens:
+        token_module.decode_token(token)
+    results["cached"] = measure(token_module.decode_token, access_tokens, args.repeat)
+    results["invalid"] = measure(rejected, invalid_tokens, args.repeat)
+
+    for mode, result in results.items():
+        print(f"{mode:>8}: {json.dumps(result)}")
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {"tokens": args.tokens, "repeat": args.repeat},
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    report = run(args)
+
+    output = args.output or RESULTS_DIR / (
+        f"{datetime.now(UTC):%Y%m%dT%H%M%S}-tokens-{report['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
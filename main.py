@@ -1,16 +1,45 @@
+import contextlib
+from pathlib import Path
+
 from fastapi import FastAPI
-from slowapi.errors import RateLimitExceeded
-from starlette.responses import JSONResponse
 
+from src.cache.response_cache import ResponseCacheMiddleware
+from src.config import settings
+from src.container import container
 from src.features.auth import auth_controller
 from src.features.contacts import contacts_controller
+from src.features.metrics import metrics_controller
+from src.metrics.instrumentation import MetricsMiddleware
+from src.rate_limit.rate_limiter import (
+    RateLimitError,
+    RateLimitMiddleware,
+    rate_limit_response,
+)
 from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    await container.startup()
+    yield
+    await container.shutdown()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 origins = ["http://localhost:3000"]
 
+# Registered before CORS so cached, 304 and 429 responses still get CORS headers.
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(ResponseCacheMiddleware)
+
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,19 +47,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Next-Cursor",
+        "X-Total-Count",
+        "X-Total-Count-Exact",
+        "ETag",
+        "Last-Modified",
+    ],
 )
 
 
-@app.exception_handler(RateLimitExceeded)
-async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(
-        status_code=429,
-        content={"error": "rate limit exceeded. Try again later"},
-    )
+@app.exception_handler(RateLimitError)
+async def rate_limit_handler(request: Request, exc: RateLimitError):
+    return rate_limit_response(exc.retry_after)
 
 
 app.include_router(contacts_controller.router, prefix="/api")
 app.include_router(auth_controller.router, prefix="/api")
+app.include_router(metrics_controller.router, prefix="/api")
+app.include_router(metrics_controller.prometheus_router)
+
+if settings.AVATAR_STORAGE == "local":
+    # StaticFiles checks the directory now; storage is only created on first upload.
+    Path(settings.AVATAR_LOCAL_DIR).mkdir(parents=True, exist_ok=True)
+    app.mount(
+        "/avatars", StaticFiles(directory=settings.AVATAR_LOCAL_DIR), name="avatars"
+    )
 
 if __name__ == "__main__":
     import uvicorn
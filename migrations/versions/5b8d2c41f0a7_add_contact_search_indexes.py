@@ -0,0 +1,33 @@
+"""Add contact search indexes
+
+Revision ID: 5b8d2c41f0a7
+Revises: 3a2ef571ede1
+Create Date: 2025-06-08 14:10:22.518304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d2c41f0a7'
+down_revision: Union[str, None] = '3a2ef571ede1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_contacts_first_name_trgm', 'contacts', ['first_name'], unique=False, postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'})
+    op.create_index('ix_contacts_last_name_trgm', 'contacts', ['last_name'], unique=False, postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'})
+    op.create_index('ix_contacts_email_trgm', 'contacts', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_email_trgm', table_name='contacts', postgresql_using='gin')
+    op.drop_index('ix_contacts_last_name_trgm', table_name='contacts', postgresql_using='gin')
+    op.drop_index('ix_contacts_first_name_trgm', table_name='contacts', postgresql_using='gin')
@@ -0,0 +1,30 @@
+"""Add birth_day_mmdd column
+
+Revision ID: 8f3a6e9d1c27
+Revises: 5b8d2c41f0a7
+Create Date: 2025-06-09 19:42:05.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a6e9d1c27'
+down_revision: Union[str, None] = '5b8d2c41f0a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('contacts', sa.Column('birth_day_mmdd', sa.SmallInteger(), sa.Computed('(EXTRACT(MONTH FROM birth_day) * 100 + EXTRACT(DAY FROM birth_day))::smallint', persisted=True), nullable=True))
+    op.create_index(op.f('ix_contacts_birth_day_mmdd'), 'contacts', ['birth_day_mmdd'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_contacts_birth_day_mmdd'), table_name='contacts')
+    op.drop_column('contacts', 'birth_day_mmdd')
@@ -0,0 +1,28 @@
+"""Add contact data index
+
+Revision ID: a8b4d1e7c2f9
+Revises: f2a9c3d8e514
+Create Date: 2025-06-16 09:13:58.240716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8b4d1e7c2f9'
+down_revision: Union[str, None] = 'f2a9c3d8e514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_contacts_data_path_ops', 'contacts', ['data'], unique=False, postgresql_using='gin', postgresql_ops={'data': 'jsonb_path_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_data_path_ops', table_name='contacts', postgresql_using='gin')
@@ -0,0 +1,34 @@
+"""Add contact listing indexes
+
+Revision ID: d7e2f4a1b6c3
+Revises: c41e7a9b5d08
+Create Date: 2025-06-14 18:22:10.417356
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e2f4a1b6c3'
+down_revision: Union[str, None] = 'c41e7a9b5d08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_contacts_verified_created_at', 'contacts', ['verified', 'created_at'], unique=False)
+    op.create_index('ix_contacts_created_at_id', 'contacts', ['created_at', 'id'], unique=False)
+    op.create_index('ix_contacts_last_name_first_name_id', 'contacts', ['last_name', 'first_name', 'id'], unique=False)
+    # Refresh pg_class.reltuples, which backs the approximate total count.
+    op.execute('ANALYZE contacts')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_last_name_first_name_id', table_name='contacts')
+    op.drop_index('ix_contacts_created_at_id', table_name='contacts')
+    op.drop_index('ix_contacts_verified_created_at', table_name='contacts')
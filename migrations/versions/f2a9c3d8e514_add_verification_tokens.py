@@ -0,0 +1,50 @@
+"""Add verification tokens
+
+Revision ID: f2a9c3d8e514
+Revises: d7e2f4a1b6c3
+Create Date: 2025-06-15 11:47:32.905127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9c3d8e514'
+down_revision: Union[str, None] = 'd7e2f4a1b6c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('verification_tokens',
+    sa.Column('token_hash', sa.String(length=64), nullable=False),
+    sa.Column('contact_id', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['contact_id'], ['contacts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('token_hash')
+    )
+    op.create_index(op.f('ix_verification_tokens_contact_id'), 'verification_tokens', ['contact_id'], unique=False)
+    op.create_index(op.f('ix_verification_tokens_expires_at'), 'verification_tokens', ['expires_at'], unique=False)
+    # Pending tokens keep working: they are stored hashed and get a fresh
+    # 48 hour window, since their issue time was never recorded.
+    op.execute(
+        "INSERT INTO verification_tokens (token_hash, contact_id, expires_at) "
+        "SELECT encode(sha256(convert_to(verification_token, 'UTF8')), 'hex'), id, "
+        "now() + interval '48 hours' "
+        "FROM contacts WHERE verification_token IS NOT NULL AND NOT verified"
+    )
+    op.drop_column('contacts', 'verification_token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Only token hashes are stored, so pending verifications cannot be restored.
+    op.add_column('contacts', sa.Column('verification_token', sa.String(length=255), nullable=True))
+    op.drop_index(op.f('ix_verification_tokens_expires_at'), table_name='verification_tokens')
+    op.drop_index(op.f('ix_verification_tokens_contact_id'), table_name='verification_tokens')
+    op.drop_table('verification_tokens')
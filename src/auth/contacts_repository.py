@@ -1,22 +1,185 @@
-import uuid
-from datetime import datetime, timedelta
-from sqlalchemy import select, extract, or_
+import calendar
+from datetime import date, datetime, timedelta
+from sqlalchemy import (
+    Integer,
+    String,
+    any_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
+from src.auth.user_cache import user_cache
+from src.cache.response_cache import response_cache
+from src.database.jsonb import apply_pointer_ops, merge_patch
 from src.database.models.contacts_model import Contact
+from src.database.models.verification_token_model import VerificationToken
 from src.auth.contact_schema import ContactModel
+from src.config import settings
+from src.features.contacts.schema.contact_filter_schema import ContactFilterModel
 from src.features.contacts.schema.contact_update_schema import ContactUpdateModel
 
+# Columns returned by the read endpoints, selected as plain rows instead of
+# full Contact entities. Secrets are never selected; the potentially large
+# `data` JSONB is only added on request.
+CONTACT_LIST_COLUMNS = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone,
+    Contact.birth_day,
+    Contact.avatar,
+)
+CONTACT_RESPONSE_COLUMNS = (*CONTACT_LIST_COLUMNS, Contact.data)
+
+
+def response_columns(include_data: bool):
+    return CONTACT_RESPONSE_COLUMNS if include_data else CONTACT_LIST_COLUMNS
+
+
+SORTABLE_COLUMNS = {
+    "id": Contact.id,
+    "first_name": Contact.first_name,
+    "last_name": Contact.last_name,
+    "email": Contact.email,
+    "birth_day": Contact.birth_day,
+    "created_at": Contact.created_at,
+}
+
+
+def parse_sort(sort: str | None) -> list:
+    """Turn `last_name,-created_at` into ORDER BY clauses, `id` last as tie-breaker."""
+    order_by = []
+    names = set()
+
+    for field in (sort or "").split(","):
+        field = field.strip()
+        if not field:
+            continue
+
+        name = field.lstrip("-")
+        column = SORTABLE_COLUMNS.get(name)
+        if column is None or name in names:
+            raise ValueError(f"Cannot sort by {name}")
+
+        names.add(name)
+        order_by.append(column.desc() if field.startswith("-") else column.asc())
+
+    if "id" not in names:
+        order_by.append(Contact.id.asc())
+
+    return order_by
+
+
+def apply_filters(stmt, filters: ContactFilterModel | None):
+    if filters is None:
+        return stmt
+
+    if filters.verified is not None:
+        stmt = stmt.where(Contact.verified == filters.verified)
+
+    if filters.created_after is not None:
+        stmt = stmt.where(Contact.created_at >= filters.created_after)
+
+    if filters.created_before is not None:
+        stmt = stmt.where(Contact.created_at < filters.created_before)
+
+    if filters.data:
+        # Served by the jsonb_path_ops GIN index on `data`.
+        stmt = stmt.where(Contact.data.contains(filters.data))
+
+    if filters.name:
+        # Prefix ILIKE is served by the gin_trgm_ops indexes on both columns.
+        stmt = stmt.where(
+            or_(
+                Contact.first_name.istartswith(filters.name, autoescape=True),
+                Contact.last_name.istartswith(filters.name, autoescape=True),
+            )
+        )
+
+    return stmt
+
 
 class ContactsRepository:
     def __init__(self, session: AsyncSession):
         self.db = session
 
-    async def get_contacts(self, skip: int, limit: int):
-        stmt = select(Contact).offset(skip).limit(limit)
+    async def get_contacts(
+        self,
+        skip: int,
+        limit: int,
+        include_data: bool = False,
+        filters: ContactFilterModel | None = None,
+        order_by: list | None = None,
+    ):
+        stmt = (
+            apply_filters(select(*response_columns(include_data)), filters)
+            .order_by(*(order_by or [Contact.id]))
+            .offset(skip)
+            .limit(limit)
+        )
         contacts = await self.db.execute(stmt)
 
-        return contacts.scalars().all()
+        return contacts.mappings().all()
+
+    async def get_contacts_after(
+        self,
+        after_id: int | None,
+        limit: int,
+        include_data: bool = False,
+        filters: ContactFilterModel | None = None,
+    ):
+        stmt = (
+            apply_filters(select(*response_columns(include_data)), filters)
+            .order_by(Contact.id)
+            .limit(limit)
+        )
+
+        if after_id is not None:
+            stmt = stmt.where(Contact.id > after_id)
+
+        contacts = await self.db.execute(stmt)
+
+        return contacts.mappings().all()
+
+    async def count_contacts(
+        self, filters: ContactFilterModel | None = None
+    ) -> tuple[int, bool]:
+        """Return `(total, exact)`.
+
+        Unfiltered counts on a large table use the planner's row estimate from
+        pg_class, which is kept current by autovacuum, instead of a full scan.
+        """
+        if filters is None or filters.is_empty():
+            stmt = text(
+                "SELECT reltuples::bigint FROM pg_class"
+                " WHERE oid = CAST(:table AS regclass)"
+            )
+            result = await self.db.execute(stmt, {"table": Contact.__tablename__})
+            estimate = result.scalar_one_or_none() or 0
+
+            if estimate >= settings.CONTACTS_EXACT_COUNT_THRESHOLD:
+                return estimate, False
+
+        stmt = apply_filters(select(func.count()).select_from(Contact), filters)
+        result = await self.db.execute(stmt)
+
+        return result.scalar_one(), True
+
+    async def get_last_modified(self) -> datetime | None:
+        stmt = select(func.max(Contact.updated_at))
+        result = await self.db.execute(stmt)
+
+        return result.scalar_one_or_none()
 
     async def get_contact_by_id(self, contact_id: int) -> Contact | None:
         stmt = select(Contact).filter_by(id=contact_id)
@@ -24,123 +187,339 @@ class ContactsRepository:
 
         return contact.scalar_one_or_none()
 
+    async def get_contact_row(self, contact_id: int, include_data: bool = False):
+        stmt = select(*response_columns(include_data)).where(Contact.id == contact_id)
+        contact = await self.db.execute(stmt)
+
+        return contact.mappings().one_or_none()
+
+    async def get_contacts_by_ids(self, ids: list[int], include_data: bool = False):
+        # One array parameter (`id = ANY(:ids)`) keeps the statement text, and
+        # so its prepared-statement cache entry, the same for any batch size.
+        stmt = select(*response_columns(include_data)).where(
+            Contact.id == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+        )
+        contacts = await self.db.execute(stmt)
+
+        return contacts.mappings().all()
+
+    async def get_contacts_by_emails(
+        self, emails: list[str], include_data: bool = False
+    ):
+        stmt = select(*response_columns(include_data)).where(
+            Contact.email == any_(bindparam("emails", emails, type_=ARRAY(String)))
+        )
+        contacts = await self.db.execute(stmt)
+
+        return contacts.mappings().all()
+
     async def search_contact(
-        self, first_name: str | None, last_name: str | None, email: str | None
+        self,
+        first_name: str | None,
+        last_name: str | None,
+        email: str | None,
+        skip: int = 0,
+        limit: int | None = None,
+        include_data: bool = False,
+        data: dict | None = None,
     ):
-        stmt = select(Contact)
+        stmt = (
+            select(*response_columns(include_data))
+            .order_by(Contact.id)
+            .offset(skip)
+            .limit(limit)
+        )
+
+        if data:
+            stmt = stmt.where(Contact.data.contains(data))
 
         if first_name:
-            stmt = stmt.filter_by(first_name=first_name)
+            stmt = stmt.where(Contact.first_name == first_name)
 
         if last_name:
-            stmt = stmt.filter_by(last_name=last_name)
+            stmt = stmt.where(Contact.last_name == last_name)
 
         if email:
-            stmt = stmt.filter_by(email=email)
+            stmt = stmt.where(Contact.email == email)
 
         contacts = await self.db.execute(stmt)
 
-        return contacts.scalars().all()
+        return contacts.mappings().all()
+
+    async def search_contact_fuzzy(
+        self,
+        query: str,
+        skip: int,
+        limit: int,
+        include_data: bool = False,
+        data: dict | None = None,
+    ):
+        # Prefix matches and trigram similarity (`%` operator) are both served
+        # by the gin_trgm_ops indexes on the searched columns.
+        columns = (Contact.first_name, Contact.last_name, Contact.email)
+        rank = func.greatest(*(func.similarity(column, query) for column in columns))
+
+        stmt = (
+            select(*response_columns(include_data))
+            .where(
+                or_(
+                    *(column.istartswith(query, autoescape=True) for column in columns),
+                    *(column.op("%")(query) for column in columns),
+                )
+            )
+            .order_by(rank.desc(), Contact.id)
+            .offset(skip)
+            .limit(limit)
+        )
+
+        if data:
+            stmt = stmt.where(Contact.data.contains(data))
+
+        contacts = await self.db.execute(stmt)
+
+        return contacts.mappings().all()
 
     async def get_contact_by_email(self, contact_email: str) -> Contact | None:
-        stmt = select(Contact).filter_by(email=contact_email)
+        """Load a contact for credential checks; `data` is not loaded."""
+        stmt = (
+            select(Contact)
+            .filter_by(email=contact_email)
+            .options(defer(Contact.data, raiseload=True))
+        )
         contact = await self.db.execute(stmt)
 
         return contact.scalar_one_or_none()
 
-    async def get_contact_by_verification_token(
-        self, verification_token: str
-    ) -> Contact | None:
-        stmt = select(Contact).filter_by(verification_token=verification_token)
+    async def email_exists(self, contact_email: str) -> bool:
+        """Index-only existence check, cheap enough to run before hashing."""
+        result = await self.db.execute(
+            select(exists().where(Contact.email == contact_email))
+        )
+
+        return result.scalar()
+
+    async def get_principal_by_email(self, contact_email: str) -> Contact | None:
+        """Load the authenticated contact without its password."""
+        stmt = (
+            select(Contact)
+            .filter_by(email=contact_email)
+            .options(defer(Contact.password, raiseload=True))
+        )
         contact = await self.db.execute(stmt)
 
         return contact.scalar_one_or_none()
 
-    async def create_contact(self, body: ContactModel) -> Contact:
-        verification_token = uuid.uuid4()
+    async def create_contact(
+        self, body: ContactModel, token_hash: str, token_expires_at: datetime
+    ) -> Contact | None:
+        """Insert a contact and its verification token; None if the email is taken.
+
+        Anything already added to the session (e.g. the welcome email in the
+        outbox) is committed with the contact, or discarded on conflict.
+        """
+        stmt = (
+            insert(Contact)
+            .values(**body.model_dump(exclude_unset=True))
+            .on_conflict_do_nothing(index_elements=[Contact.email])
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
 
-        contact = Contact(
-            verification_token=str(verification_token),
-            **body.model_dump(exclude_unset=True),
+        if contact is None:
+            await self.db.rollback()
+            return None
+
+        await self.db.execute(
+            insert(VerificationToken).values(
+                token_hash=token_hash,
+                contact_id=contact.id,
+                expires_at=token_expires_at,
+            )
         )
-        self.db.add(contact)
         await self.db.commit()
-        await self.db.refresh(contact)
+        await response_cache.invalidate()
 
-        return await self.get_contact_by_id(contact.id)
+        return contact
 
-    async def update_contact(
-        self, contact_id: int, body: ContactUpdateModel
-    ) -> Contact | None:
-        contact = await self.get_contact_by_id(contact_id)
+    async def replace_verification_token(
+        self, contact_id: int, token_hash: str, token_expires_at: datetime
+    ):
+        """Swap the contact's outstanding tokens for a new one and commit.
 
-        if not contact:
-            return None
+        Anything already added to the session is committed with it, like in
+        `create_contact`.
+        """
+        await self.db.execute(
+            delete(VerificationToken).where(VerificationToken.contact_id == contact_id)
+        )
+        await self.db.execute(
+            insert(VerificationToken).values(
+                token_hash=token_hash,
+                contact_id=contact_id,
+                expires_at=token_expires_at,
+            )
+        )
+        await self.db.commit()
 
-        if body.first_name:
-            contact.first_name = body.first_name
+    async def create_contacts_bulk(self, rows: list[dict]) -> set[str]:
+        """Multi-row insert skipping existing emails; returns the inserted emails."""
+        if not rows:
+            return set()
 
-        if body.last_name:
-            contact.last_name = body.last_name
+        stmt = (
+            insert(Contact.__table__)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Contact.email])
+            .returning(Contact.email)
+        )
+        result = await self.db.execute(stmt)
+        emails = set(result.scalars().all())
+        await self.db.commit()
 
-        if body.birth_day:
-            contact.birth_day = body.birth_day
+        if emails:
+            await response_cache.invalidate()
 
-        if body.phone:
-            contact.phone = body.phone
+        return emails
 
-        if body.data:
-            contact.data = body.data
+    async def stream_contacts(self, batch_size: int):
+        """Yield contacts as plain dicts from a server-side cursor."""
+        stmt = select(*CONTACT_RESPONSE_COLUMNS).order_by(Contact.id)
+        result = await self.db.stream(stmt.execution_options(yield_per=batch_size))
 
+        async for row in result.mappings():
+            yield dict(row)
+
+    async def _update_contact_values(
+        self, contact_id: int, values: dict
+    ) -> Contact | None:
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id)
+            .values(**values)
+            .returning(Contact)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(contact)
+
+        if contact:
+            await user_cache.invalidate(contact.email)
+            await response_cache.invalidate()
 
         return contact
 
+    async def update_contact(
+        self, contact_id: int, body: ContactUpdateModel
+    ) -> Contact | None:
+        values = {
+            field: value
+            for field, value in body.model_dump(
+                include={"first_name", "last_name", "birth_day", "phone", "data"}
+            ).items()
+            if value
+        }
+
+        # Partial updates are computed by Postgres from the stored document in
+        # the same UPDATE, so concurrent patches to different keys don't clash.
+        if body.data_patch is not None:
+            values["data"] = merge_patch(Contact.data, body.data_patch)
+        elif body.data_ops:
+            values["data"] = apply_pointer_ops(
+                Contact.data, [op.model_dump() for op in body.data_ops]
+            )
+
+        if not values:
+            return await self.get_contact_by_id(contact_id)
+
+        return await self._update_contact_values(contact_id, values)
+
     async def delete_contact(self, contact_id: int) -> Contact | None:
-        contact = await self.get_contact_by_id(contact_id)
+        stmt = delete(Contact).where(Contact.id == contact_id).returning(Contact)
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
+
         if contact:
-            await self.db.delete(contact)
-            await self.db.commit()
+            await user_cache.invalidate(contact.email)
+            await response_cache.invalidate()
 
         return contact
 
-    async def bd_soon(self, days: int) -> list[Contact]:
+    async def bd_soon(self, days: int, include_data: bool = False):
         today = datetime.now().date()
         end_date = today + timedelta(days=days)
 
-        stmt = select(Contact).where(
-            or_(
-                # Case 1: Birthday within the same month
-                (extract("month", Contact.birth_day) == today.month)
-                & (extract("day", Contact.birth_day) >= today.day)
-                & (extract("day", Contact.birth_day) <= end_date.day),
-                # Case 2: Birthday in the next month
-                (extract("month", Contact.birth_day) == end_date.month)
-                & (extract("day", Contact.birth_day) <= end_date.day)
-                & (today.month != end_date.month),
-            )
-        )
+        stmt = select(*response_columns(include_data))
 
-        contacts = await self.db.execute(stmt)
-        return contacts.scalars().all()
+        if days < 365:
+            start_mmdd = today.month * 100 + today.day
+            end_mmdd = end_date.month * 100 + end_date.day
 
-    async def verify_email(self, email: str):
-        contact = await self.get_contact_by_email(email)
+            if end_date.year == today.year:
+                # Window within one calendar year
+                condition = Contact.birth_day_mmdd.between(start_mmdd, end_mmdd)
+            else:
+                # Window wraps from December into January
+                condition = or_(
+                    Contact.birth_day_mmdd >= start_mmdd,
+                    Contact.birth_day_mmdd <= end_mmdd,
+                )
 
-        if contact:
-            contact.verified = True
-            contact.verification_token = None
-            await self.db.commit()
-            await self.db.refresh(contact)
+            # Feb 29 birthdays are celebrated on Mar 1 in non-leap years
+            if any(
+                not calendar.isleap(year) and today <= date(year, 3, 1) <= end_date
+                for year in range(today.year, end_date.year + 1)
+            ):
+                condition = or_(condition, Contact.birth_day_mmdd == 229)
 
-    async def update_avatar_url(self, contact_id, avatar_url):
-        contact = await self.get_contact_by_id(contact_id)
+            stmt = stmt.where(condition)
 
-        if not contact:
-            return None
+        contacts = await self.db.execute(stmt)
+        return contacts.mappings().all()
+
+    async def verify_email(self, token_hash: str) -> str | None:
+        """Consume a live token and verify its contact in one statement.
+
+        Returns the verified email, or None for an unknown, expired or used token.
+        """
+        used = (
+            delete(VerificationToken)
+            .where(
+                VerificationToken.token_hash == token_hash,
+                VerificationToken.expires_at > func.now(),
+            )
+            .returning(VerificationToken.contact_id)
+            .cte("used")
+        )
+        stmt = (
+            update(Contact)
+            .where(Contact.id == used.c.contact_id, Contact.verified.is_(False))
+            .values(verified=True)
+            .returning(Contact.email)
+            # The ORM cannot sync session state through the CTE join, and no
+            # Contact from this statement is loaded in the session anyway.
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        email = result.scalar_one_or_none()
+        await self.db.commit()
+
+        if email:
+            await user_cache.invalidate(email)
+            await response_cache.invalidate()
+
+        return email
 
-        contact.avatar = avatar_url
+    async def update_password(self, contact_id: int, password_hash: str):
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id)
+            .values(password=password_hash)
+        )
+        await self.db.execute(stmt)
         await self.db.commit()
 
-        return contact
+    async def update_avatar_url(self, contact_id, avatar_url):
+        return await self._update_contact_values(contact_id, {"avatar": avatar_url})
@@ -1,19 +1,26 @@
-from datetime import datetime, timedelta, UTC
-from typing import Optional
+import asyncio
+import secrets
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 
 from fastapi import Depends, HTTPException, status
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError, jwt
+from jose import JWTError
 
+from src.auth.tokens import decode_token
+from src.auth.user_cache import user_cache
 from src.auth.users_service import UserService
 from src.config import settings
 from src.database.db import get_db
+from src.metrics.instrumentation import track_external
 
 
 class Hash:
     pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    _dummy_hash: str | None = None
 
     def verify_password(self, plain_password, hashed_password):
         return self.pwd_context.verify(plain_password, hashed_password)
@@ -21,21 +28,131 @@ class Hash:
     def get_password_hash(self, password: str):
         return self.pwd_context.hash(password)
 
+    async def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Verify off the event loop; also return a rehash for outdated hashes."""
+        rounds, min_rounds = bcrypt_rounds()
+        return await hash_executor.run(
+            _verify_and_update, plain_password, hashed_password, rounds, min_rounds
+        )
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+    async def get_password_hash_async(self, password: str) -> str:
+        rounds, _ = bcrypt_rounds()
+        return await hash_executor.run(_hash, password, rounds)
+
+    async def dummy_verify(self, plain_password: str):
+        """Spend the same time as a real verify, for logins of unknown accounts."""
+        if Hash._dummy_hash is None:
+            Hash._dummy_hash = await self.get_password_hash_async(
+                secrets.token_urlsafe(16)
+            )
+        await self.verify_and_update_password(plain_password, Hash._dummy_hash)
+
+
+def calibrate_bcrypt_rounds(target_ms: int, min_rounds: int, max_rounds: int) -> int:
+    """Pick the highest bcrypt cost whose hash time stays within `target_ms`.
+
+    Runs synchronously; call it from a worker thread at startup.
+    """
+    rounds = min_rounds
+    for candidate in range(min_rounds, max_rounds + 1):
+        start = time.perf_counter()
+        Hash.pwd_context.handler("bcrypt").using(rounds=candidate).hash("calibration")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms > target_ms:
+            break
+        rounds = candidate
+        # Each extra round doubles the cost; stop once the next one cannot fit.
+        if elapsed_ms * 2 > target_ms:
+            break
+
+    # Hashes below the new cost are upgraded on the next successful login.
+    Hash.pwd_context.update(bcrypt__rounds=rounds, bcrypt__min_rounds=rounds)
+    Hash._dummy_hash = None
+    return rounds
 
 
-async def create_access_token(data: dict, expires_delta: Optional[int] = None):
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
-    else:
-        expire = datetime.now(UTC) + timedelta(seconds=settings.JWT_EXPIRATION_SECONDS)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+def bcrypt_rounds() -> tuple[int, int | None]:
+    """Current (rounds, min_rounds) of Hash.pwd_context, as set by calibration."""
+    handler = Hash.pwd_context.handler("bcrypt")
+    return handler.default_rounds, handler.min_desired_rounds
+
+
+# The cost is passed explicitly because process-pool workers have their own
+# copy of Hash.pwd_context and never see the rounds calibrated at startup.
+@lru_cache(maxsize=None)
+def _context(rounds: int, min_rounds: int | None) -> CryptContext:
+    options = {"bcrypt__rounds": rounds}
+    if min_rounds is not None:
+        options["bcrypt__min_rounds"] = min_rounds
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", **options)
+
+
+# Module-level so they can be pickled for a process pool.
+def _verify_and_update(
+    plain_password: str, hashed_password: str, rounds: int, min_rounds: int | None
+):
+    return _context(rounds, min_rounds).verify_and_update(
+        plain_password, hashed_password
     )
-    return encoded_jwt
+
+
+def _hash(password: str, rounds: int):
+    return _context(rounds, None).hash(password)
+
+
+class HashExecutor:
+    def __init__(self, kind: str, max_workers: int, max_concurrency: int):
+        self.kind = kind
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.queue_depth = 0
+        self.in_flight = 0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hash"
+                )
+        return self._executor
+
+    async def run(self, fn, *args):
+        self.queue_depth += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            async with track_external("bcrypt"):
+                return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {"queue_depth": self.queue_depth, "in_flight": self.in_flight}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+hash_executor = HashExecutor(
+    settings.HASH_EXECUTOR, settings.HASH_MAX_WORKERS, settings.HASH_MAX_CONCURRENCY
+)
+
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
 async def get_current_user(
@@ -48,17 +165,19 @@ async def get_current_user(
     )
 
     try:
-        # Decode JWT
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        # Decode JWT (signature checks are cached until the token expires)
+        payload = decode_token(token)
         username = payload["sub"]
         if username is None:
             raise credentials_exception
-    except JWTError as e:
+    except (JWTError, KeyError) as e:
         raise credentials_exception
+    user = await user_cache.get(username)
+    if user is not None:
+        return user
     user_service = UserService(db)
     user = await user_service.get_user_by_username(username)
     if user is None:
         raise credentials_exception
+    await user_cache.set(username, user)
     return user
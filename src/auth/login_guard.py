@@ -0,0 +1,56 @@
+import math
+import time
+
+from fastapi import HTTPException
+from starlette import status
+
+from src.config import settings
+from src.rate_limit.rate_limiter import create_limits_storage
+
+
+class LoginGuard:
+    """Failed-login counters per account and per client IP.
+
+    Counters live in the same `limits` storage as the rate limiter, so they are
+    shared between workers when that storage is Redis. Each counter expires
+    LOGIN_LOCKOUT_SECONDS after its first failure.
+    """
+
+    def __init__(self, storage_uri: str):
+        self.storage = create_limits_storage(storage_uri)
+        self.lockouts = 0
+
+    @staticmethod
+    def _keys(email: str, client_ip: str) -> list[tuple[str, int]]:
+        account_key = f"login-fail:account:{email.lower()}"
+        ip_key = f"login-fail:ip:{client_ip}"
+        return [
+            (account_key, settings.LOGIN_MAX_ACCOUNT_FAILURES),
+            (ip_key, settings.LOGIN_MAX_IP_FAILURES),
+        ]
+
+    async def ensure_allowed(self, email: str, client_ip: str):
+        """Reject locked-out attempts before any password hashing happens."""
+        for key, max_failures in self._keys(email, client_ip):
+            if await self.storage.get(key) >= max_failures:
+                self.lockouts += 1
+                retry_after = await self.storage.get_expiry(key) - time.time()
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many failed login attempts. Try again later",
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                )
+
+    async def record_failure(self, email: str, client_ip: str):
+        for key, _ in self._keys(email, client_ip):
+            await self.storage.incr(key, settings.LOGIN_LOCKOUT_SECONDS)
+
+    async def record_success(self, email: str):
+        key, _ = self._keys(email, "")[0]
+        await self.storage.clear(key)
+
+    def stats(self) -> dict:
+        return {"lockouts": self.lockouts}
+
+
+login_guard = LoginGuard(settings.RATE_LIMIT_STORAGE_URI)
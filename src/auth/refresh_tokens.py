@@ -0,0 +1,42 @@
+import time
+
+from src.config import settings
+from src.rate_limit.rate_limiter import create_limits_storage
+
+
+class RefreshTokenStore:
+    """Single-use refresh tokens, tracked by their `jti`.
+
+    Each refresh consumes the presented token and issues a new one, so a stolen
+    token stops working once either party has used it. Used ids live in the same
+    `limits` storage as the rate limiter (shared between workers when that is
+    Redis) and expire together with the token they belong to.
+    """
+
+    def __init__(self, storage_uri: str):
+        self.storage = create_limits_storage(storage_uri)
+        self.reuse_rejections = 0
+
+    @staticmethod
+    def _key(jti: str) -> str:
+        return f"refresh-used:{jti}"
+
+    async def _mark_used(self, payload: dict) -> int:
+        expiry = max(1, int(payload["exp"] - time.time()) + 1)
+        return await self.storage.incr(self._key(payload["jti"]), expiry)
+
+    async def consume(self, payload: dict) -> bool:
+        """Mark the token used; False if it had already been used or revoked."""
+        if await self._mark_used(payload) > 1:
+            self.reuse_rejections += 1
+            return False
+        return True
+
+    async def revoke(self, payload: dict):
+        await self._mark_used(payload)
+
+    def stats(self) -> dict:
+        return {"reuse_rejections": self.reuse_rejections}
+
+
+refresh_tokens = RefreshTokenStore(settings.RATE_LIMIT_STORAGE_URI)
@@ -0,0 +1,127 @@
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from jose import JWTError, jwt
+
+from src.config import settings
+
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+
+
+class KeyRing:
+    """Signing keys by `kid`. New tokens use the active key; any listed key verifies.
+
+    To rotate, add the new key, make it active, and drop the old key once the
+    longest-lived token signed with it has expired.
+    """
+
+    def __init__(self, keys: dict[str, str], active_kid: str):
+        if active_kid not in keys:
+            raise ValueError(f"Active JWT key {active_kid!r} is not configured")
+        self.keys = keys
+        self.active_kid = active_kid
+
+    @property
+    def active_key(self) -> str:
+        return self.keys[self.active_kid]
+
+    def get(self, kid: str | None) -> str | None:
+        return self.keys.get(kid or self.active_kid)
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of already verified tokens, each kept until its own `exp`."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: OrderedDict[str, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> dict | None:
+        payload = self._items.get(token)
+        if payload is None:
+            self.misses += 1
+            return None
+
+        if payload["exp"] <= time.time():
+            del self._items[token]
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(token)
+        self.hits += 1
+        return payload
+
+    def set(self, token: str, payload: dict):
+        self._items[token] = payload
+        self._items.move_to_end(token)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._items)}
+
+
+def create_key_ring() -> KeyRing:
+    if settings.JWT_KEYS:
+        return KeyRing(settings.JWT_KEYS, settings.JWT_ACTIVE_KID)
+
+    return KeyRing({"default": settings.JWT_SECRET}, "default")
+
+
+key_ring = create_key_ring()
+token_cache = VerifiedTokenCache(settings.JWT_VERIFIED_CACHE_SIZE)
+
+
+def _encode(data: dict, token_type: str, expires_in: int) -> str:
+    to_encode = data.copy()
+    to_encode.update(
+        {
+            "exp": datetime.now(UTC) + timedelta(seconds=expires_in),
+            "type": token_type,
+        }
+    )
+    return jwt.encode(
+        to_encode,
+        key_ring.active_key,
+        algorithm=settings.JWT_ALGORITHM,
+        headers={"kid": key_ring.active_kid},
+    )
+
+
+def create_access_token(data: dict, expires_delta: Optional[int] = None) -> str:
+    expires_in = expires_delta or settings.JWT_EXPIRATION_SECONDS
+    return _encode(data, ACCESS_TOKEN, expires_in)
+
+
+def create_refresh_token(data: dict) -> str:
+    return _encode(
+        {**data, "jti": uuid.uuid4().hex},
+        REFRESH_TOKEN,
+        settings.JWT_REFRESH_EXPIRATION_SECONDS,
+    )
+
+
+def decode_token(token: str, token_type: str = ACCESS_TOKEN) -> dict:
+    """Return the verified payload, raising JWTError for invalid tokens."""
+    payload = token_cache.get(token)
+
+    if payload is None:
+        key = key_ring.get(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise JWTError("Unknown signing key")
+
+        payload = jwt.decode(token, key, algorithms=[settings.JWT_ALGORITHM])
+        token_cache.set(token, payload)
+
+    # Tokens issued before refresh tokens existed have no type: access tokens.
+    if payload.get("type", ACCESS_TOKEN) != token_type:
+        raise JWTError("Unexpected token type")
+
+    return payload
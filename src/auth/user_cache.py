@@ -0,0 +1,130 @@
+import json
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+
+from src.config import settings
+from src.database.models.contacts_model import Contact
+
+# Secrets are never written to the cache; cached principals are read-only views.
+EXCLUDED_FIELDS = {"password"}
+
+
+def contact_to_dict(contact: Contact) -> dict:
+    return {
+        column.key: getattr(contact, column.key)
+        for column in Contact.__table__.columns
+        if column.key not in EXCLUDED_FIELDS
+    }
+
+
+def contact_from_dict(data: dict) -> Contact:
+    return Contact(**data)
+
+
+class InMemoryCacheBackend:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    async def get(self, key: str) -> dict | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+
+        self._items.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: dict, ttl: int):
+        self._items[key] = (time.monotonic() + ttl, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    async def delete(self, key: str):
+        self._items.pop(key, None)
+
+    async def close(self):
+        self._items.clear()
+
+
+class RedisCacheBackend:
+    """Shared backend for any client exposing redis.asyncio's get/set/delete."""
+
+    def __init__(self, client, prefix: str = "principal:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> dict | None:
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+
+        data = json.loads(raw)
+        for field in ("birth_day",):
+            if data.get(field):
+                data[field] = date.fromisoformat(data[field])
+        for field in ("created_at", "updated_at"):
+            if data.get(field):
+                data[field] = datetime.fromisoformat(data[field])
+
+        return data
+
+    async def set(self, key: str, value: dict, ttl: int):
+        await self.client.set(self.prefix + key, json.dumps(value, default=str), ex=ttl)
+
+    async def delete(self, key: str):
+        await self.client.delete(self.prefix + key)
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class UserCache:
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, username: str) -> Contact | None:
+        data = await self.backend.get(username)
+
+        if data is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return contact_from_dict(data)
+
+    async def set(self, username: str, contact: Contact):
+        await self.backend.set(username, contact_to_dict(contact), self.ttl)
+
+    async def invalidate(self, username: str):
+        await self.backend.delete(username)
+
+    async def close(self):
+        await self.backend.close()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def create_user_cache() -> UserCache:
+    if settings.USER_CACHE_REDIS_URL:
+        import redis.asyncio as redis
+
+        backend = RedisCacheBackend(redis.from_url(settings.USER_CACHE_REDIS_URL))
+    else:
+        backend = InMemoryCacheBackend(settings.USER_CACHE_MAX_SIZE)
+
+    return UserCache(backend, settings.USER_CACHE_TTL_SECONDS)
+
+
+user_cache = create_user_cache()
@@ -7,4 +7,4 @@ class UserService:
         self.repository = ContactsRepository(db)
 
     async def get_user_by_username(self, email: str):
-        return await self.repository.get_contact_by_email(email)
+        return await self.repository.get_principal_by_email(email)
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+
+from src.auth.verification_token_repository import VerificationTokenRepository
+from src.config import settings
+from src.database.db import sessionmanager
+
+logger = logging.getLogger(__name__)
+
+
+class VerificationTokenPurger:
+    """Periodically deletes expired verification tokens in short batches."""
+
+    def __init__(self):
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    def start(self):
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def run(self):
+        while not self._stopping.is_set():
+            try:
+                purged = await self.purge()
+                if purged:
+                    logger.info("Purged %s expired verification tokens", purged)
+            except Exception:
+                logger.exception("Verification token purge failed")
+
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), settings.VERIFICATION_PURGE_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def purge(self) -> int:
+        # One transaction per batch keeps row locks and WAL bursts small.
+        total = 0
+        while not self._stopping.is_set():
+            async with sessionmanager.session() as session:
+                deleted = await VerificationTokenRepository(session).purge_expired(
+                    settings.VERIFICATION_PURGE_BATCH_SIZE
+                )
+
+            total += deleted
+            if deleted < settings.VERIFICATION_PURGE_BATCH_SIZE:
+                break
+
+        return total
@@ -0,0 +1,29 @@
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.verification_token_model import VerificationToken
+
+
+class VerificationTokenRepository:
+    def __init__(self, session: AsyncSession):
+        self.db = session
+
+    async def purge_expired(self, batch_size: int) -> int:
+        """Delete up to `batch_size` expired tokens; returns how many were removed."""
+        expired = (
+            select(VerificationToken.token_hash)
+            .where(VerificationToken.expires_at <= func.now())
+            .order_by(VerificationToken.expires_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            delete(VerificationToken)
+            .where(VerificationToken.token_hash.in_(expired.scalar_subquery()))
+            .returning(VerificationToken.token_hash)
+        )
+        result = await self.db.execute(stmt)
+        deleted = len(result.all())
+        await self.db.commit()
+
+        return deleted
@@ -0,0 +1,18 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, UTC
+
+from src.config import settings
+
+
+def hash_verification_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def new_verification_token() -> tuple[str, datetime]:
+    """Return a fresh token for the email link and its expiry time."""
+    expires_at = datetime.now(UTC) + timedelta(
+        seconds=settings.VERIFICATION_TOKEN_TTL_SECONDS
+    )
+
+    return secrets.token_urlsafe(32), expires_at
@@ -0,0 +1,252 @@
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from email.utils import format_datetime, parsedate_to_datetime
+from urllib.parse import urlencode
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.config import settings
+from src.database.db import primary_reads
+
+# Public, unauthenticated GET routes whose responses depend only on contacts data.
+CACHEABLE_PATHS = [
+    re.compile(r"^/api/contacts/$"),
+    re.compile(r"^/api/contacts/\d+$"),
+    re.compile(r"^/api/contacts/soon_celebrate$"),
+]
+# Responses that depend on today's date stop being valid at midnight.
+DAILY_PATHS = [re.compile(r"^/api/contacts/soon_celebrate$")]
+CACHED_HEADERS = [
+    "content-type",
+    "x-next-cursor",
+    "x-total-count",
+    "x-total-count-exact",
+]
+
+
+@dataclass
+class CacheEntry:
+    version: int
+    body: bytes
+    headers: dict
+    etag: str
+    last_modified: datetime
+    expires_at: float | None
+
+
+class InMemoryVersionStore:
+    """Per-process version; use the Redis store when running several workers.
+
+    Other workers never see this version change, so a cache using it bounds
+    entry age with RESPONSE_CACHE_LOCAL_MAX_AGE_SECONDS.
+    """
+
+    def __init__(self):
+        self._version = 0
+        self._last_modified = datetime.now(UTC)
+
+    async def get(self) -> tuple[int, datetime]:
+        return self._version, self._last_modified
+
+    async def bump(self, last_modified: datetime):
+        self._version += 1
+        self._last_modified = last_modified
+
+    async def close(self):
+        pass
+
+
+class RedisVersionStore:
+    def __init__(self, client, prefix: str = "contacts:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self) -> tuple[int, datetime]:
+        version, last_modified = await self.client.mget(
+            self.prefix + "version", self.prefix + "last_modified"
+        )
+        if last_modified is None:
+            return int(version or 0), datetime.now(UTC)
+        if isinstance(last_modified, bytes):
+            last_modified = last_modified.decode()
+        return int(version or 0), datetime.fromisoformat(last_modified)
+
+    async def bump(self, last_modified: datetime):
+        await self.client.set(self.prefix + "last_modified", last_modified.isoformat())
+        await self.client.incr(self.prefix + "version")
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class ResponseCache:
+    def __init__(self, version_store, max_entries: int, max_age: float | None = None):
+        self.version_store = version_store
+        self.max_entries = max_entries
+        # Upper bound on entry lifetime, for stores that other workers can't bump.
+        self.max_age = max_age
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+    async def version(self) -> tuple[int, datetime]:
+        return await self.version_store.get()
+
+    async def invalidate(self):
+        await self.version_store.bump(datetime.now(UTC))
+
+    async def initialize(self, last_modified: datetime | None):
+        """Seed Last-Modified from the newest contacts.updated_at on startup."""
+        if last_modified is not None:
+            await self.version_store.bump(last_modified)
+
+    async def close(self):
+        self._entries.clear()
+        await self.version_store.close()
+
+    def get(self, key: str, version: int) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expired = entry.expires_at is not None and entry.expires_at <= time.time()
+        if entry.version != version or expired:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        if self.max_age is not None:
+            expires_at = time.time() + self.max_age
+            if entry.expires_at is None or expires_at < entry.expires_at:
+                entry.expires_at = expires_at
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "bytes_saved": self.bytes_saved,
+            "entries": len(self._entries),
+        }
+
+
+def create_response_cache() -> ResponseCache:
+    if settings.RESPONSE_CACHE_REDIS_URL:
+        import redis.asyncio as redis
+
+        store = RedisVersionStore(redis.from_url(settings.RESPONSE_CACHE_REDIS_URL))
+        max_age = None
+    else:
+        store = InMemoryVersionStore()
+        max_age = settings.RESPONSE_CACHE_LOCAL_MAX_AGE_SECONDS
+
+    return ResponseCache(store, settings.RESPONSE_CACHE_MAX_ENTRIES, max_age)
+
+
+response_cache = create_response_cache()
+
+
+def next_midnight() -> float:
+    tomorrow = datetime.now().date() + timedelta(days=1)
+    return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+
+
+def is_not_modified(request: Request, entry: CacheEntry) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return entry.etag in [tag.strip() for tag in if_none_match.split(",")]
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return entry.last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        if request.method != "GET" or not any(p.match(path) for p in CACHEABLE_PATHS):
+            return await call_next(request)
+
+        query = urlencode(sorted(request.query_params.multi_items()))
+        # List routes can answer with NDJSON instead of JSON depending on Accept.
+        ndjson = "application/x-ndjson" in request.headers.get("accept", "")
+        key = f"{path}?{query}|{'ndjson' if ndjson else 'json'}"
+        version, last_modified = await response_cache.version()
+        entry = response_cache.get(key, version)
+
+        if entry is not None:
+            response_cache.hits += 1
+        else:
+            response_cache.misses += 1
+            # A replica may not have the write behind this version yet; whatever
+            # is read now is cached under it until the next write.
+            since_write = datetime.now(UTC) - last_modified
+            token = primary_reads.set(
+                since_write.total_seconds()
+                < settings.RESPONSE_CACHE_PRIMARY_WINDOW_SECONDS
+            )
+            try:
+                response = await call_next(request)
+                if response.status_code != 200:
+                    return response
+
+                body = b"".join([chunk async for chunk in response.body_iterator])
+            finally:
+                primary_reads.reset(token)
+            entry = CacheEntry(
+                version=version,
+                body=body,
+                headers={
+                    name: response.headers[name]
+                    for name in CACHED_HEADERS
+                    if name in response.headers
+                },
+                etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+                last_modified=last_modified,
+                expires_at=(
+                    next_midnight() if any(p.match(path) for p in DAILY_PATHS) else None
+                ),
+            )
+            response_cache.set(key, entry)
+
+        headers = {
+            **entry.headers,
+            "etag": entry.etag,
+            "last-modified": format_datetime(
+                entry.last_modified.astimezone(UTC), usegmt=True
+            ),
+            "cache-control": "no-cache",
+            "vary": "Accept",
+        }
+
+        if is_not_modified(request, entry):
+            response_cache.not_modified += 1
+            response_cache.bytes_saved += len(entry.body)
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=entry.body, headers=headers)
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Concurrent calls for the same key share one in-flight call.
+
+    The shared call runs as its own task, so a caller that is cancelled (for
+    example on client disconnect) does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]):
+        future = self._calls.get(key)
+
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future):
+        self._calls.pop(key, None)
+        # Mark the exception as retrieved in case every waiter went away.
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": len(self._calls),
+        }
@@ -5,6 +5,8 @@ from src.config import settings
 
 
 class UploadFileService:
+    """Cloudinary avatar storage. Configure once and reuse the instance."""
+
     def __init__(self):
         self.cloud_name = settings.CLOUDINARY_NAME
         self.api_key = settings.CLOUDINARY_API_KEY
@@ -17,9 +19,10 @@ class UploadFileService:
         )
 
     @staticmethod
-    def upload_file(file, username) -> str:
+    def upload_file(file, username, content_type: str | None = None) -> str:
+        # Cloudinary detects the format itself; content_type is for local storage.
         public_id = f"ContactsApp/{username}"
-        r = cloudinary.uploader.upload(file.file, public_id=public_id, overwrite=True)
+        r = cloudinary.uploader.upload(file, public_id=public_id, overwrite=True)
         src_url = cloudinary.CloudinaryImage(public_id).build_url(
             width=250, height=250, crop="fill", version=r.get("version")
         )
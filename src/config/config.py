@@ -4,9 +4,23 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DB_URL: str
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_REPLICA_URLS: list[str] = []
+    DB_REPLICA_RETRY_AFTER_SECONDS: int = 30
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
+    JWT_REFRESH_EXPIRATION_SECONDS: int = 30 * 24 * 3600
+    # kid -> secret; when empty JWT_SECRET is the only key
+    JWT_KEYS: dict[str, str] = {}
+    JWT_ACTIVE_KID: str | None = None
+    JWT_VERIFIED_CACHE_SIZE: int = 10000
     HOST: str
     MAIL_USERNAME: str
     MAIL_PASSWORD: str
@@ -14,9 +28,92 @@ class Settings(BaseSettings):
     MAIL_PORT: int
     MAIL_SERVER: str
     MAIL_FROM_NAME: str
+    MAIL_STARTTLS: bool = False
+    MAIL_SSL_TLS: bool = True
+    MAIL_USE_CREDENTIALS: bool = True
+    MAIL_VALIDATE_CERTS: bool = True
+    EMAIL_WORKER_ENABLED: bool = True
+    EMAIL_BATCH_SIZE: int = 50
+    EMAIL_POLL_INTERVAL_SECONDS: float = 2.0
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BACKOFF_SECONDS: int = 30
+    # Claimed messages are hidden from other workers for this long
+    EMAIL_CLAIM_LEASE_SECONDS: int = 300
+    # Sent and dead-lettered messages are deleted after this long
+    EMAIL_RETENTION_SECONDS: int = 604800
+    EMAIL_PURGE_INTERVAL_SECONDS: int = 3600
+    EMAIL_PURGE_BATCH_SIZE: int = 1000
+    VERIFICATION_TOKEN_TTL_SECONDS: int = 172800
+    VERIFICATION_PURGE_ENABLED: bool = True
+    VERIFICATION_PURGE_INTERVAL_SECONDS: int = 3600
+    VERIFICATION_PURGE_BATCH_SIZE: int = 1000
     CLOUDINARY_NAME: str
     CLOUDINARY_API_KEY: str
     CLOUDINARY_API_SECRET: str
+    CONTACTS_IMPORT_BATCH_SIZE: int = 1000
+    CONTACTS_IMPORT_MAX_ERRORS: int = 1000
+    CONTACTS_EXPORT_BATCH_SIZE: int = 1000
+    CONTACTS_EXACT_COUNT_THRESHOLD: int = 100000
+    CONTACTS_BATCH_MAX_KEYS: int = 100
+    AVATAR_STORAGE: str = "cloudinary"
+    AVATAR_LOCAL_DIR: str = "avatars"
+    AVATAR_MAX_BYTES: int = 5 * 1024 * 1024
+    AVATAR_ALLOWED_TYPES: list[str] = [
+        "image/jpeg",
+        "image/png",
+        "image/gif",
+        "image/webp",
+    ]
+    AVATAR_RESIZE: bool = False
+    AVATAR_UPLOAD_CONCURRENCY: int = 4
+    AVATAR_CACHE_DIR: str = "avatar_cache"
+    AVATAR_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    AVATAR_CACHE_TTL_SECONDS: int = 86400
+    AVATAR_CACHE_MAX_AGE_SECONDS: int = 86400
+    AVATAR_FETCH_TIMEOUT_SECONDS: float = 5.0
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_REDIS_URL: str | None = None
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_REDIS_URL: str | None = None
+    # Without Redis, other workers never see a write's version bump, so entries
+    # expire after this long instead
+    RESPONSE_CACHE_LOCAL_MAX_AGE_SECONDS: float = 5.0
+    # After a write, cache misses read from the primary for this long; keep it
+    # above the worst expected replica lag
+    RESPONSE_CACHE_PRIMARY_WINDOW_SECONDS: float = 5.0
+    RATE_LIMIT_ENABLED: bool = True
+    # `limits` storage URI, e.g. async+redis://localhost:6379 to share counters
+    RATE_LIMIT_STORAGE_URI: str = "async+memory://"
+    RATE_LIMIT_POLICIES: dict[str, str] = {
+        "default": "300/minute",
+        "login": "10/minute",
+        "refresh": "30/minute",
+        "signup": "5/minute",
+        "verify_resend": "3/minute",
+        "search": "60/minute",
+        "avatar": "10/minute",
+        "import": "5/minute",
+        "me": "10/minute",
+    }
+    LOGIN_MAX_ACCOUNT_FAILURES: int = 5
+    LOGIN_MAX_IP_FAILURES: int = 50
+    LOGIN_LOCKOUT_SECONDS: int = 900
+    # When set, bcrypt rounds are calibrated at startup to roughly this hash time
+    BCRYPT_TARGET_MS: int | None = None
+    BCRYPT_MIN_ROUNDS: int = 10
+    BCRYPT_MAX_ROUNDS: int = 15
+    METRICS_ENABLED: bool = True
+    # Bearer token required by /metrics and /api/metrics; unset hides both
+    METRICS_TOKEN: str | None = None
+    # When set, a sample of requests is stack-profiled and logged if slower
+    PROFILE_SLOW_REQUEST_MS: int | None = None
+    PROFILE_SAMPLE_RATE: float = 0.1
+    PROFILE_INTERVAL_MS: int = 5
+    HASH_EXECUTOR: str = "thread"
+    HASH_MAX_WORKERS: int = 4
+    HASH_MAX_CONCURRENCY: int = 8
     model_config = ConfigDict(
         extra="ignore", env_file=".env", env_file_encoding="utf-8", case_sensitive=True
     )
@@ -0,0 +1,83 @@
+import asyncio
+from functools import cached_property
+
+from src.auth.contacts_repository import ContactsRepository
+from src.auth.hash import Hash, calibrate_bcrypt_rounds, hash_executor
+from src.auth.user_cache import user_cache
+from src.cache.response_cache import response_cache
+from src.config import settings
+from src.database.db import read_sessionmanager, sessionmanager
+
+
+class Container:
+    """Process-wide clients, built once and torn down by the app lifespan.
+
+    Optional subsystems are created on first access, so a worker that never
+    uploads an avatar never configures the storage backend.
+    """
+
+    @cached_property
+    def hash(self) -> Hash:
+        return Hash()
+
+    @cached_property
+    def avatar_upload_service(self):
+        from src.storage.avatar_upload_service import (
+            AvatarUploadService,
+            create_storage,
+        )
+
+        return AvatarUploadService(create_storage(), settings.AVATAR_UPLOAD_CONCURRENCY)
+
+    @cached_property
+    def avatar_proxy(self):
+        from src.storage.avatar_cache import AvatarDiskCache
+        from src.storage.avatar_proxy import AvatarProxy
+
+        return AvatarProxy(
+            AvatarDiskCache(settings.AVATAR_CACHE_DIR, settings.AVATAR_CACHE_MAX_BYTES),
+            settings.AVATAR_CACHE_TTL_SECONDS,
+        )
+
+    @cached_property
+    def email_worker(self):
+        from src.email.email_worker import EmailOutboxWorker
+
+        return EmailOutboxWorker()
+
+    @cached_property
+    def verification_token_purger(self):
+        from src.auth.verification_token_purger import VerificationTokenPurger
+
+        return VerificationTokenPurger()
+
+    async def startup(self):
+        if settings.BCRYPT_TARGET_MS:
+            await asyncio.to_thread(
+                calibrate_bcrypt_rounds,
+                settings.BCRYPT_TARGET_MS,
+                settings.BCRYPT_MIN_ROUNDS,
+                settings.BCRYPT_MAX_ROUNDS,
+            )
+        await sessionmanager.warm_up(settings.DB_POOL_SIZE)
+        async with sessionmanager.session() as session:
+            last_modified = await ContactsRepository(session).get_last_modified()
+        await response_cache.initialize(last_modified)
+        if settings.EMAIL_WORKER_ENABLED:
+            self.email_worker.start()
+        if settings.VERIFICATION_PURGE_ENABLED:
+            self.verification_token_purger.start()
+
+    async def shutdown(self):
+        if "email_worker" in self.__dict__:
+            await self.email_worker.stop()
+        if "verification_token_purger" in self.__dict__:
+            await self.verification_token_purger.stop()
+        hash_executor.shutdown()
+        await user_cache.close()
+        await response_cache.close()
+        await read_sessionmanager.close()
+        await sessionmanager.close()
+
+
+container = Container()
@@ -1,2 +1,2 @@
-from .db import get_db, Base
-from .models import contacts_model
\ No newline at end of file
+from .db import get_db, get_read_db, Base
+from .models import contacts_model, email_outbox_model, verification_token_model
\ No newline at end of file
@@ -1,32 +1,107 @@
+import asyncio
 import contextlib
+import itertools
+import time
+from contextvars import ContextVar
 
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
+    AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config import settings
+from src.metrics.instrumentation import instrument_engine
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class PoolWaitStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, seconds: float):
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+def timed_pool_class(stats: PoolWaitStats):
+    # The engine recreates its pool on dispose(), so the stats live outside it.
+    class TimedQueuePool(AsyncAdaptedQueuePool):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                stats.record(time.perf_counter() - start)
+
+    return TimedQueuePool
+
+
+def engine_options(url: str) -> dict:
+    options = {
+        "echo": settings.DB_ECHO,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if url.startswith("postgresql+asyncpg"):
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+        }
+    return options
+
+
 class DatabaseSessionManager:
-    def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url, echo=True)
-        self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
-        )
+    """Owns one engine, created on first use so importing the app stays cheap."""
+
+    def __init__(self, url: str, **engine_kwargs):
+        self.url = url
+        self.engine_kwargs = engine_kwargs
+        self.wait_stats = PoolWaitStats()
+        self._engine: AsyncEngine | None = None
+        self._session_maker: async_sessionmaker | None = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(
+                self.url,
+                poolclass=timed_pool_class(self.wait_stats),
+                **self.engine_kwargs,
+            )
+            instrument_engine(self._engine)
+            # expire_on_commit=False lets RETURNING-loaded rows be used after commit
+            # without another SELECT.
+            self._session_maker = async_sessionmaker(
+                autoflush=False,
+                autocommit=False,
+                expire_on_commit=False,
+                bind=self._engine,
+            )
+        return self._engine
+
+    @property
+    def session_maker(self) -> async_sessionmaker:
+        if self._session_maker is None:
+            self.engine
+        return self._session_maker
 
     @contextlib.asynccontextmanager
     async def session(self):
-        if self._session_maker is None:
-            raise Exception("Database session is not initialized")
-        session = self._session_maker()
+        session = self.session_maker()
         try:
             yield session
         except SQLAlchemyError as e:
@@ -35,10 +110,124 @@ class DatabaseSessionManager:
         finally:
             await session.close()
 
+    async def warm_up(self, connections: int):
+        """Open pooled connections up front so first requests don't pay for them."""
+
+        async def ping():
+            async with self.engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(ping() for _ in range(connections)))
+
+    async def close(self):
+        if self._engine is None:
+            return
+        await self._engine.dispose()
+        self._engine = None
+        self._session_maker = None
+
+    def pool_stats(self) -> dict:
+        pool = self._engine.pool if self._engine is not None else None
+        return {
+            "size": pool.size() if pool else 0,
+            "checked_in": pool.checkedin() if pool else 0,
+            "checked_out": pool.checkedout() if pool else 0,
+            "overflow": pool.overflow() if pool else 0,
+            "checkouts": self.wait_stats.checkouts,
+            "wait_seconds_total": self.wait_stats.wait_seconds_total,
+            "wait_seconds_max": self.wait_stats.wait_seconds_max,
+        }
+
+
+# Set while serving a request whose result must not come from a lagging replica.
+primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+class ReplicaSessionManager:
+    """Hands out sessions on read replicas, round-robin, falling back to the primary.
+
+    A replica that fails to connect is skipped for `retry_after` seconds.
+    """
+
+    def __init__(
+        self,
+        primary: DatabaseSessionManager,
+        replicas: list[DatabaseSessionManager],
+        retry_after: int,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_after = retry_after
+        self._counter = itertools.count()
+        self._down_until = [0.0] * len(replicas)
 
-sessionmanager = DatabaseSessionManager(settings.DB_URL)
+    def _candidates(self):
+        if not self.replicas:
+            return
+        start = next(self._counter)
+        now = time.monotonic()
+        for i in range(len(self.replicas)):
+            index = (start + i) % len(self.replicas)
+            if self._down_until[index] <= now:
+                yield index
+
+    async def _open_session(self) -> AsyncSession:
+        if primary_reads.get():
+            return self.primary.session_maker()
+
+        for index in self._candidates():
+            session = self.replicas[index].session_maker()
+            try:
+                await session.connection()
+                return session
+            except (SQLAlchemyError, OSError):
+                await session.close()
+                self._down_until[index] = time.monotonic() + self.retry_after
+
+        return self.primary.session_maker()
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        session = await self._open_session()
+        try:
+            yield session
+        except SQLAlchemyError as e:
+            await session.rollback()
+            raise  # Re-raise the original error
+        finally:
+            await session.close()
+
+    async def close(self):
+        for replica in self.replicas:
+            await replica.close()
+
+    def replica_stats(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {"healthy": self._down_until[index] <= now, **replica.pool_stats()}
+            for index, replica in enumerate(self.replicas)
+        ]
+
+
+sessionmanager = DatabaseSessionManager(
+    settings.DB_URL, **engine_options(settings.DB_URL)
+)
+read_sessionmanager = ReplicaSessionManager(
+    sessionmanager,
+    [
+        DatabaseSessionManager(url, **engine_options(url))
+        for url in settings.DB_REPLICA_URLS
+    ],
+    settings.DB_REPLICA_RETRY_AFTER_SECONDS,
+)
 
 
 async def get_db():
     async with sessionmanager.session() as session:
         yield session
+
+
+async def get_read_db():
+    """Session for read-only endpoints; never use it for read-after-write flows."""
+    async with read_sessionmanager.session() as session:
+        yield session
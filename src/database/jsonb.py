@@ -0,0 +1,70 @@
+"""SQL expressions for updating JSONB columns in place."""
+
+from sqlalchemy import Text, case, func, literal, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+
+def parse_pointer(pointer: str) -> list[str]:
+    """Split an RFC 6901 JSON pointer (`/a/b~1c`) into path segments."""
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+
+    return [
+        segment.replace("~1", "/").replace("~0", "~")
+        for segment in pointer[1:].split("/")
+    ]
+
+
+def as_object(target):
+    return case(
+        (func.jsonb_typeof(target) == "object", target),
+        else_=func.jsonb_build_object(),
+    )
+
+
+def merge_patch(target, patch: dict):
+    """RFC 7386 merge patch of `patch` into the `target` expression.
+
+    Null removes a key, nested objects are merged recursively and any other
+    value replaces the existing one.
+    """
+    result = as_object(target)
+
+    removed = [key for key, value in patch.items() if value is None]
+    if removed:
+        result = result.op("-")(literal(removed, ARRAY(Text)))
+
+    replaced = {
+        key: value
+        for key, value in patch.items()
+        if value is not None and not isinstance(value, dict)
+    }
+    if replaced:
+        result = result.op("||")(literal(replaced, JSONB))
+
+    merged = []
+    for key, value in patch.items():
+        if isinstance(value, dict):
+            child = type_coerce(target, JSONB).op("->", return_type=JSONB)(key)
+            merged.extend((key, merge_patch(child, value)))
+    if merged:
+        result = result.op("||")(func.jsonb_build_object(*merged))
+
+    return type_coerce(result, JSONB)
+
+
+def apply_pointer_ops(target, ops: list[dict]):
+    """Apply `set`/`remove` operations at JSON pointers, in order.
+
+    `set` creates the last path segment if missing; parent objects must exist.
+    """
+    result = func.coalesce(target, func.jsonb_build_object())
+
+    for op in ops:
+        path = literal(parse_pointer(op["path"]), ARRAY(Text))
+        if op["op"] == "set":
+            result = func.jsonb_set(result, path, literal(op["value"], JSONB), True)
+        else:
+            result = result.op("#-")(path)
+
+    return type_coerce(result, JSONB)
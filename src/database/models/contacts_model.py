@@ -1,4 +1,13 @@
-from sqlalchemy import Integer, String, DateTime, func, Date
+from sqlalchemy import (
+    Integer,
+    SmallInteger,
+    String,
+    DateTime,
+    func,
+    Date,
+    Index,
+    Computed,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -7,6 +16,37 @@ from src.database.db import Base
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index(
+            "ix_contacts_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        # Filtered and sorted listings
+        Index("ix_contacts_verified_created_at", "verified", "created_at"),
+        Index("ix_contacts_created_at_id", "created_at", "id"),
+        Index("ix_contacts_last_name_first_name_id", "last_name", "first_name", "id"),
+        # Containment (`data @> ...`) filters
+        Index(
+            "ix_contacts_data_path_ops",
+            "data",
+            postgresql_using="gin",
+            postgresql_ops={"data": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     first_name: Mapped[str] = mapped_column(String(50))
@@ -16,11 +56,21 @@ class Contact(Base):
     birth_day: Mapped[DateTime] = mapped_column(
         Date(), nullable=False, server_default=func.now()
     )
+    # Birthday as MMDD (e.g. 1231), indexed for upcoming-birthday range scans
+    birth_day_mmdd: Mapped[int] = mapped_column(
+        SmallInteger,
+        Computed(
+            "(EXTRACT(MONTH FROM birth_day) * 100"
+            " + EXTRACT(DAY FROM birth_day))::smallint",
+            persisted=True,
+        ),
+        nullable=True,
+        index=True,
+    )
     data: Mapped[dict] = mapped_column(JSONB, nullable=True)
     password: Mapped[str] = mapped_column(String(255))
     avatar: Mapped[str] = mapped_column(String(255), nullable=True)
     verified: Mapped[bool] = mapped_column(default=False)
-    verification_token: Mapped[str] = mapped_column(String(255), nullable=True)
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -0,0 +1,21 @@
+from sqlalchemy import ForeignKey, Integer, String, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.db import Base
+
+
+class VerificationToken(Base):
+    __tablename__ = "verification_tokens"
+
+    # SHA-256 hex digest. The raw token is only kept in the outbox until its
+    # email is sent or dead-lettered.
+    token_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    contact_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("contacts.id", ondelete="CASCADE"), index=True
+    )
+    expires_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    created_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
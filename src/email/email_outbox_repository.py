@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy import Text, delete, select, update
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.email_outbox_model import EmailOutbox
+
+# Template values that must not outlive delivery, e.g. one-time link tokens.
+SECRET_TEMPLATE_KEYS = ("token",)
+
+
+def scrubbed_template_body():
+    return EmailOutbox.template_body.op("-")(array(SECRET_TEMPLATE_KEYS, type_=Text))
+
+
+class EmailOutboxRepository:
+    def __init__(self, session: AsyncSession):
+        self.db = session
+
+    async def enqueue(
+        self,
+        recipient: str,
+        subject: str,
+        template_name: str,
+        template_body: dict,
+        commit: bool = True,
+    ) -> EmailOutbox:
+        """Queue a message; with `commit=False` it joins the caller's transaction."""
+        message = EmailOutbox(
+            recipient=recipient,
+            subject=subject,
+            template_name=template_name,
+            template_body=template_body,
+        )
+        self.db.add(message)
+        if commit:
+            await self.db.commit()
+
+        return message
+
+    async def claim_batch(self, limit: int, lease: int) -> list[EmailOutbox]:
+        """Lease due messages to this worker and commit, releasing the row locks.
+
+        Claimed rows get `next_attempt_at` pushed `lease` seconds ahead, so other
+        workers skip them while they are sent. If this worker dies mid-batch,
+        they become due again once the lease runs out.
+        """
+        now = datetime.now(UTC)
+        due = (
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.status == EmailOutbox.STATUS_PENDING,
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(due.scalar_subquery()))
+            .values(next_attempt_at=now + timedelta(seconds=lease))
+            .returning(EmailOutbox)
+            .execution_options(synchronize_session=False)
+        )
+        messages = (await self.db.execute(stmt)).scalars().all()
+        await self.db.commit()
+
+        return sorted(messages, key=lambda message: message.id)
+
+    async def mark_sent(self, message: EmailOutbox):
+        """Record delivery and drop secrets from the body; it is never sent again."""
+        stmt = (
+            update(EmailOutbox)
+            .where(EmailOutbox.id == message.id)
+            .values(
+                status=EmailOutbox.STATUS_SENT,
+                sent_at=datetime.now(UTC),
+                template_body=scrubbed_template_body(),
+            )
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+    async def mark_failed(
+        self, message: EmailOutbox, error: str, max_attempts: int, backoff: int
+    ):
+        attempts = message.attempts + 1
+        values = {"attempts": attempts, "last_error": error}
+
+        if attempts >= max_attempts:
+            values["status"] = EmailOutbox.STATUS_DEAD
+            values["template_body"] = scrubbed_template_body()
+        else:
+            delay = backoff * 2 ** (attempts - 1)
+            values["next_attempt_at"] = datetime.now(UTC) + timedelta(seconds=delay)
+
+        stmt = update(EmailOutbox).where(EmailOutbox.id == message.id).values(**values)
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+    async def purge_finished(self, older_than: int, batch_size: int) -> int:
+        """Delete up to `batch_size` sent or dead messages older than `older_than`
+        seconds; returns how many were removed."""
+        cutoff = datetime.now(UTC) - timedelta(seconds=older_than)
+        finished = (
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.status != EmailOutbox.STATUS_PENDING,
+                EmailOutbox.created_at < cutoff,
+            )
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            delete(EmailOutbox)
+            .where(EmailOutbox.id.in_(finished.scalar_subquery()))
+            .returning(EmailOutbox.id)
+        )
+        result = await self.db.execute(stmt)
+        deleted = len(result.all())
+        await self.db.commit()
+
+        return deleted
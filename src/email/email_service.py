@@ -1,8 +1,6 @@
 from pathlib import Path
 
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
-from fastapi_mail.errors import ConnectionErrors
-from pydantic import EmailStr
+from fastapi_mail import ConnectionConfig
 
 from src.config import settings
 
@@ -13,26 +11,10 @@ conf = ConnectionConfig(
     MAIL_PORT=settings.MAIL_PORT,
     MAIL_SERVER=settings.MAIL_SERVER,
     MAIL_FROM_NAME=settings.MAIL_FROM_NAME,
-    MAIL_STARTTLS=False,
-    MAIL_SSL_TLS=True,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True,
+    MAIL_STARTTLS=settings.MAIL_STARTTLS,
+    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
+    USE_CREDENTIALS=settings.MAIL_USE_CREDENTIALS,
+    VALIDATE_CERTS=settings.MAIL_VALIDATE_CERTS,
     TEMPLATE_FOLDER=Path(__file__).parent / "templates",
 )
 
-
-async def send_email(
-    email: EmailStr, subject: str, template_name: str, template_body: dict
-):
-    try:
-        message = MessageSchema(
-            subject=subject,
-            recipients=[email],
-            template_body=template_body,
-            subtype=MessageType.html,
-        )
-
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name=template_name)
-    except ConnectionErrors as err:
-        print(err)
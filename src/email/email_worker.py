@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from email.message import EmailMessage
+from email.utils import formataddr
+
+import aiosmtplib
+
+from src.config import settings
+from src.database.db import sessionmanager
+from src.email.email_outbox_repository import EmailOutboxRepository
+from src.email.email_service import conf
+from src.metrics.instrumentation import track_external
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxWorker:
+    """Delivers queued outbox messages in batches over one reused SMTP connection."""
+
+    def __init__(self):
+        self.templates = conf.template_engine()
+        self._smtp: aiosmtplib.SMTP | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+        self._next_purge_at = 0.0
+
+    def start(self):
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        await self._task
+        self._task = None
+        await self._disconnect()
+
+    async def run(self):
+        while not self._stopping.is_set():
+            try:
+                sent = await self.process_batch()
+            except Exception:
+                logger.exception("Email outbox batch failed")
+                sent = 0
+
+            if time.monotonic() >= self._next_purge_at:
+                self._next_purge_at = (
+                    time.monotonic() + settings.EMAIL_PURGE_INTERVAL_SECONDS
+                )
+                try:
+                    purged = await self.purge()
+                    if purged:
+                        logger.info("Purged %s finished outbox messages", purged)
+                except Exception:
+                    logger.exception("Email outbox purge failed")
+
+            # Drain the backlog without waiting; otherwise poll.
+            if sent < settings.EMAIL_BATCH_SIZE:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), settings.EMAIL_POLL_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    async def process_batch(self) -> int:
+        """Send one claimed batch; each message's outcome is committed on its own.
+
+        A message that cannot be rendered or sent only fails itself: it is
+        retried with backoff and dead-lettered after EMAIL_MAX_ATTEMPTS.
+        """
+        async with sessionmanager.session() as session:
+            repository = EmailOutboxRepository(session)
+            messages = await repository.claim_batch(
+                settings.EMAIL_BATCH_SIZE, settings.EMAIL_CLAIM_LEASE_SECONDS
+            )
+
+            sent = 0
+            for message in messages:
+                try:
+                    await self._send(message)
+                except Exception as err:
+                    if isinstance(err, (aiosmtplib.SMTPException, OSError)):
+                        await self._disconnect()
+                    else:
+                        logger.exception("Email %s could not be built", message.id)
+                    await repository.mark_failed(
+                        message,
+                        str(err) or type(err).__name__,
+                        settings.EMAIL_MAX_ATTEMPTS,
+                        settings.EMAIL_RETRY_BACKOFF_SECONDS,
+                    )
+                    continue
+
+                await repository.mark_sent(message)
+                sent += 1
+
+            return sent
+
+    async def purge(self) -> int:
+        """Delete sent and dead messages past EMAIL_RETENTION_SECONDS in batches."""
+        total = 0
+        while not self._stopping.is_set():
+            async with sessionmanager.session() as session:
+                deleted = await EmailOutboxRepository(session).purge_finished(
+                    settings.EMAIL_RETENTION_SECONDS, settings.EMAIL_PURGE_BATCH_SIZE
+                )
+
+            total += deleted
+            if deleted < settings.EMAIL_PURGE_BATCH_SIZE:
+                break
+
+        return total
+
+    def _build_message(self, message) -> EmailMessage:
+        template = self.templates.get_template(message.template_name)
+
+        email = EmailMessage()
+        email["From"] = formataddr((settings.MAIL_FROM_NAME, settings.MAIL_FROM))
+        email["To"] = message.recipient
+        email["Subject"] = message.subject
+        email.set_content(template.render(**message.template_body), subtype="html")
+
+        return email
+
+    async def _send(self, message):
+        async with track_external("smtp"):
+            smtp = await self._connect()
+            await smtp.send_message(self._build_message(message))
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        if self._smtp is not None and self._smtp.is_connected:
+            return self._smtp
+
+        self._smtp = aiosmtplib.SMTP(
+            hostname=settings.MAIL_SERVER,
+            port=settings.MAIL_PORT,
+            use_tls=settings.MAIL_SSL_TLS,
+            start_tls=settings.MAIL_STARTTLS,
+            validate_certs=settings.MAIL_VALIDATE_CERTS,
+        )
+        await self._smtp.connect()
+
+        if settings.MAIL_USE_CREDENTIALS:
+            await self._smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+
+        return self._smtp
+
+    async def _disconnect(self):
+        if self._smtp is None:
+            return
+
+        try:
+            if self._smtp.is_connected:
+                await self._smtp.quit()
+        except aiosmtplib.SMTPException:
+            self._smtp.close()
+        finally:
+            self._smtp = None
@@ -1,19 +1,54 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from starlette import status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
 from src.features.auth.auth_service import AuthService
 from src.features.auth.schema.login_response_schema import LoginResponseModel
 from src.features.auth.schema.login_schema import LoginModel
+from src.features.auth.schema.refresh_schema import RefreshModel
+from src.features.auth.schema.resend_verification_schema import (
+    ResendVerificationModel,
+)
+from src.rate_limit.rate_limiter import rate_limit
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/login", response_model=LoginResponseModel)
-async def login(body: LoginModel, db: AsyncSession = Depends(get_db)):
+@router.post(
+    "/login",
+    response_model=LoginResponseModel,
+    dependencies=[Depends(rate_limit("login"))],
+)
+async def login(
+    request: Request, body: LoginModel, db: AsyncSession = Depends(get_db)
+):
     auth_service = AuthService(db)
+    client_ip = request.client.host if request.client else "unknown"
 
-    return await auth_service.login(body)
+    return await auth_service.login(body, client_ip)
+
+
+@router.post(
+    "/refresh",
+    response_model=LoginResponseModel,
+    dependencies=[Depends(rate_limit("refresh"))],
+)
+async def refresh(body: RefreshModel, db: AsyncSession = Depends(get_db)):
+    auth_service = AuthService(db)
+
+    return await auth_service.refresh(body.refresh_token)
+
+
+@router.post(
+    "/logout",
+    status_code=204,
+    dependencies=[Depends(rate_limit("refresh"))],
+)
+async def logout(body: RefreshModel, db: AsyncSession = Depends(get_db)):
+    auth_service = AuthService(db)
+
+    await auth_service.logout(body.refresh_token)
 
 
 @router.get("/verify/{verification_token}", status_code=200)
@@ -23,3 +58,17 @@ async def login(verification_token: str, db: AsyncSession = Depends(get_db)):
     await auth_service.verify_email(verification_token)
 
     return "Verified"
+
+
+@router.post(
+    "/verify/resend",
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(rate_limit("verify_resend"))],
+)
+async def resend_verification(
+    body: ResendVerificationModel, db: AsyncSession = Depends(get_db)
+):
+    auth_service = AuthService(db)
+
+    # Same answer for every address, so this can't be used to probe accounts.
+    await auth_service.resend_verification(body.email)
@@ -1,50 +1,134 @@
 from fastapi import HTTPException
+from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from src.auth.contacts_repository import ContactsRepository
-from src.auth.hash import Hash, create_access_token
+from src.auth.login_guard import login_guard
+from src.auth.refresh_tokens import refresh_tokens
+from src.auth.tokens import (
+    REFRESH_TOKEN,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
+from src.auth.verification_tokens import hash_verification_token, new_verification_token
+from src.config import settings
+from src.container import container
+from src.email.email_outbox_repository import EmailOutboxRepository
 from src.features.auth.schema.login_schema import LoginModel
 
 
 class AuthService:
     def __init__(self, db: AsyncSession):
         self.contacts_repository = ContactsRepository(db)
+        self.email_outbox_repository = EmailOutboxRepository(db)
+
+    async def login(self, schema: LoginModel, client_ip: str):
+        await login_guard.ensure_allowed(schema.email, client_ip)
 
-    async def login(self, schema: LoginModel):
         contact = await self.contacts_repository.get_contact_by_email(schema.email)
 
-        if not contact or not contact.verified:
+        # Unknown accounts still pay for one verify so timing does not reveal them.
+        if contact:
+            password_verified, new_hash = (
+                await container.hash.verify_and_update_password(
+                    schema.password, contact.password
+                )
+            )
+        else:
+            await container.hash.dummy_verify(schema.password)
+            password_verified, new_hash = False, None
+
+        if not password_verified or not contact.verified:
+            await login_guard.record_failure(schema.email, client_ip)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Incorrect email or password",
             )
 
-        password_verified = Hash().verify_password(schema.password, contact.password)
+        await login_guard.record_success(schema.email)
+
+        if new_hash:
+            await self.contacts_repository.update_password(contact.id, new_hash)
+
+        return self._issue_tokens(contact.email)
+
+    async def refresh(self, refresh_token: str):
+        payload = self._decode_refresh_token(refresh_token)
 
-        if not password_verified:
+        # Refresh tokens are single-use; each call rotates to a new one.
+        if not await refresh_tokens.consume(payload):
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Incorrect email or password",
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+            )
+
+        email = payload["sub"]
+        contact = await self.contacts_repository.get_contact_by_email(email)
+
+        if not contact or not contact.verified:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+            )
+
+        return self._issue_tokens(contact.email)
+
+    async def logout(self, refresh_token: str):
+        await refresh_tokens.revoke(self._decode_refresh_token(refresh_token))
+
+    @staticmethod
+    def _decode_refresh_token(refresh_token: str) -> dict:
+        try:
+            payload = decode_token(refresh_token, REFRESH_TOKEN)
+        except JWTError:
+            payload = {}
+
+        if not payload.get("sub") or not payload.get("jti"):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
             )
 
-        access_token = await create_access_token({"sub": contact.email})
+        return payload
 
-        return {"access_token": access_token, "token_type": "bearer"}
+    @staticmethod
+    def _issue_tokens(email: str):
+        return {
+            "access_token": create_access_token({"sub": email}),
+            "refresh_token": create_refresh_token({"sub": email}),
+            "token_type": "bearer",
+        }
 
     async def verify_email(self, verification_token: str):
-        contact = await self.contacts_repository.get_contact_by_verification_token(
-            verification_token
+        email = await self.contacts_repository.verify_email(
+            hash_verification_token(verification_token)
         )
 
-        if not contact:
+        if not email:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Verification failed"
             )
 
-        if contact.verified:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="Email already verified"
-            )
+    async def resend_verification(self, email: str):
+        """Replace an unverified contact's token and email the new link.
+
+        Unknown and already verified addresses are silently ignored.
+        """
+        contact = await self.contacts_repository.get_contact_by_email(email)
 
-        await self.contacts_repository.verify_email(contact.email)
+        if not contact or contact.verified:
+            return
+
+        token, expires_at = new_verification_token()
+        await self.email_outbox_repository.enqueue(
+            contact.email,
+            "Verify your email",
+            "verify_email.html",
+            {"token": token, "host": settings.HOST, "first_name": contact.first_name},
+            commit=False,
+        )
+        await self.contacts_repository.replace_verification_token(
+            contact.id, hash_verification_token(token), expires_at
+        )
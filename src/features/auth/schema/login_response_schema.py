@@ -3,4 +3,5 @@ from pydantic import BaseModel
 
 class LoginResponseModel(BaseModel):
     access_token: str
+    refresh_token: str | None = None
     token_type: str
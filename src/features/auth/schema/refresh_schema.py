@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+
+
+class RefreshModel(BaseModel):
+    refresh_token: str
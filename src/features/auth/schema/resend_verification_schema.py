@@ -0,0 +1,5 @@
+from pydantic import BaseModel, Field
+
+
+class ResendVerificationModel(BaseModel):
+    email: str = Field(max_length=120)
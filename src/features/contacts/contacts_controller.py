@@ -1,54 +1,179 @@
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, status, HTTPException, Request, UploadFile, File
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    HTTPException,
+    Request,
+    UploadFile,
+    File,
+    Query,
+)
+from fastapi.responses import RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from src.auth.hash import get_current_user
-from src.cloudinary.upload_file_service import UploadFileService
-from src.database import get_db
+from src.config import settings
+from src.container import container
+from src.database import get_db, get_read_db
+from src.features.contacts.contacts_serializer import contact_list_response
 from src.features.contacts.contacts_service import ContactsService
+from src.features.contacts.contacts_transfer_service import ContactsTransferService
+from src.features.contacts.schema.contact_batch_schema import (
+    ContactBatchRequestModel,
+    ContactBatchResponseModel,
+)
 from src.features.contacts.schema.contact_create_schema import ContactCreateModel
+from src.features.contacts.schema.contact_filter_schema import (
+    ContactFilterModel,
+    parse_data_filter,
+)
+from src.features.contacts.schema.contact_import_response_schema import (
+    ContactImportResponseModel,
+)
 from src.features.contacts.schema.contact_response_schema import ContactResponseModel
 from src.auth.contact_schema import ContactModel
 from src.features.contacts.schema.contact_update_schema import ContactUpdateModel
+from src.rate_limit.rate_limiter import rate_limit
+from src.storage.avatar_proxy import (
+    AvatarFetchError,
+    avatar_response,
+    is_proxied_avatar,
+)
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
-limiter = Limiter(key_func=get_remote_address)
+
+
+def include_data(include: Optional[str] = None) -> bool:
+    """`?include=data` adds the `data` JSONB to read responses."""
+    return "data" in (include or "").split(",")
+
+
+def data_filter(request: Request) -> dict | None:
+    """`data.<path>=<value>` params, matched against the `data` JSONB."""
+    try:
+        return parse_data_filter(request.query_params.multi_items())
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def contact_filters(
+    verified: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    name: Optional[str] = Query(None, min_length=1, max_length=50),
+    data: Optional[dict] = Depends(data_filter),
+) -> ContactFilterModel:
+    return ContactFilterModel(
+        verified=verified,
+        created_after=created_after,
+        created_before=created_before,
+        name=name,
+        data=data,
+    )
 
 
 @router.get("/", response_model=list[ContactResponseModel])
 async def get_contacts(
-    skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    sort: Optional[str] = None,
+    total: bool = False,
+    filters: ContactFilterModel = Depends(contact_filters),
+    with_data: bool = Depends(include_data),
+    db: AsyncSession = Depends(get_read_db),
 ):
     contacts_service = ContactsService(db)
-    contacts = await contacts_service.get_contacts(skip, limit)
 
-    return contacts
+    # Passing `cursor` (empty for the first page) switches to keyset pagination;
+    # the cursor for the following page is returned in the X-Next-Cursor header.
+    if cursor is not None:
+        if sort:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="sort is not supported with cursor pagination",
+            )
+
+        contacts, next_cursor = await contacts_service.get_contacts_page(
+            cursor, limit, with_data, filters
+        )
+        response = contact_list_response(request, contacts)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+    else:
+        contacts = await contacts_service.get_contacts(
+            skip, limit, with_data, filters, sort
+        )
+        response = contact_list_response(request, contacts)
+
+    # `?total=true` adds X-Total-Count; X-Total-Count-Exact is "false" when the
+    # total is the planner estimate for a large unfiltered table.
+    if total:
+        count, exact = await contacts_service.count_contacts(filters)
+        response.headers["X-Total-Count"] = str(count)
+        response.headers["X-Total-Count-Exact"] = "true" if exact else "false"
 
+    return response
 
-@router.get("/search", response_model=list[ContactResponseModel])
+
+@router.get(
+    "/search",
+    response_model=list[ContactResponseModel],
+    dependencies=[Depends(rate_limit("search"))],
+)
 async def search(
+    request: Request,
     first_name: Optional[str] = None,
     last_name: Optional[str] = None,
     email: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    q: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    data: Optional[dict] = Depends(data_filter),
+    with_data: bool = Depends(include_data),
+    db: AsyncSession = Depends(get_read_db),
 ):
     contacts_service = ContactsService(db)
+    contacts = await contacts_service.search(
+        first_name, last_name, email, q, skip, limit, with_data, data
+    )
+
+    return contact_list_response(request, contacts)
 
-    return await contacts_service.search(first_name, last_name, email)
+
+@router.post("/batch", response_model=ContactBatchResponseModel)
+async def get_contacts_batch(
+    body: ContactBatchRequestModel,
+    with_data: bool = Depends(include_data),
+    db: AsyncSession = Depends(get_read_db),
+):
+    contacts_service = ContactsService(db)
+
+    return await contacts_service.get_contacts_batch(body.ids, body.emails, with_data)
 
 
 @router.get("/soon_celebrate", response_model=list[ContactResponseModel])
-async def search(db: AsyncSession = Depends(get_db)):
+async def search(
+    request: Request,
+    days: int = Query(7, ge=0, le=365),
+    with_data: bool = Depends(include_data),
+    db: AsyncSession = Depends(get_read_db),
+):
     contacts_service = ContactsService(db)
+    contacts = await contacts_service.soon_celebrate(days, with_data)
 
-    return await contacts_service.soon_celebrate()
+    return contact_list_response(request, contacts)
 
 
 @router.post(
-    "/signup", response_model=ContactResponseModel, status_code=status.HTTP_201_CREATED
+    "/signup",
+    response_model=ContactResponseModel,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("signup"))],
 )
 async def create_contact(body: ContactCreateModel, db: AsyncSession = Depends(get_db)):
     contacts_service = ContactsService(db)
@@ -56,25 +181,85 @@ async def create_contact(body: ContactCreateModel, db: AsyncSession = Depends(ge
     return await contacts_service.create_contact(body)
 
 
-@router.get("/me", response_model=ContactModel)
-@limiter.limit("10/minute")
-async def me(request: Request, contact: ContactModel = Depends(get_current_user)):
+@router.post(
+    "/import",
+    response_model=ContactImportResponseModel,
+    dependencies=[Depends(rate_limit("import"))],
+)
+async def import_contacts(
+    request: Request,
+    contact: ContactModel = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    transfer_service = ContactsTransferService(db)
+
+    return await transfer_service.import_contacts(
+        request.stream(), request.headers.get("content-type", "")
+    )
+
+
+@router.get("/export")
+async def export_contacts(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    contact: ContactModel = Depends(get_current_user),
+):
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+
+    return StreamingResponse(
+        ContactsTransferService.export_contacts(export_format), media_type=media_type
+    )
+
+
+@router.get(
+    "/me", response_model=ContactModel, dependencies=[Depends(rate_limit("me"))]
+)
+async def me(contact: ContactModel = Depends(get_current_user)):
     return contact
 
 
 @router.get("/{contact_id}", response_model=ContactResponseModel)
-async def get_contact(contact_id: int, db: AsyncSession = Depends(get_db)):
-    contacts_service = ContactsService(db)
-    return await contacts_service.get_contact_by_id(contact_id)
+async def get_contact(
+    contact_id: int,
+    with_data: bool = Depends(include_data),
+):
+    return await ContactsService.get_contact_by_id(contact_id, with_data)
+
+
+@router.get("/{contact_id}/avatar")
+async def get_avatar(request: Request, contact_id: int):
+    source = await ContactsService.get_avatar_source(contact_id)
+
+    # Locally stored avatars are already served by the /avatars mount.
+    if source.startswith(f"{settings.HOST}/avatars/"):
+        return RedirectResponse(source)
 
+    # Anything else is only proxied from allow-listed hosts, never redirected to.
+    if not is_proxied_avatar(source):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Avatar not found"
+        )
 
-@router.patch("/avatar", response_model=ContactResponseModel)
+    try:
+        entry = await container.avatar_proxy.get(source)
+    except AvatarFetchError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Avatar not found"
+        )
+
+    return avatar_response(request, entry)
+
+
+@router.patch(
+    "/avatar",
+    response_model=ContactResponseModel,
+    dependencies=[Depends(rate_limit("avatar"))],
+)
 async def update_avatar_user(
     file: UploadFile = File(),
     contact: ContactModel = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    avatar_url = UploadFileService().upload_file(file, contact.id)
+    avatar_url = await container.avatar_upload_service.upload(file, contact.id)
 
     contacts_service = ContactsService(db)
     return await contacts_service.update_avatar_url(contact.id, avatar_url)
@@ -0,0 +1,40 @@
+import json
+from typing import Iterable, Mapping
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - declared dependency, kept optional
+    orjson = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def dumps(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+
+class ContactListResponse(Response):
+    """JSON array of contact rows, bypassing per-row Pydantic validation.
+
+    Rows come from the repository already limited to the response columns,
+    so they serialize to the same shape as ContactResponseModel.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Iterable[Mapping]) -> bytes:
+        return dumps([dict(row) for row in content])
+
+
+def contact_list_response(request: Request, rows: Iterable[Mapping]) -> Response:
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            (dumps(dict(row)) + b"\n" for row in rows), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    return ContactListResponse(rows)
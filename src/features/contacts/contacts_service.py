@@ -1,62 +1,162 @@
 from fastapi import HTTPException
-from libgravatar import Gravatar
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from src.auth.contacts_repository import ContactsRepository
+from src.auth.contacts_repository import ContactsRepository, parse_sort
 from src.auth.contact_schema import ContactModel
-from src.auth.hash import Hash
-from src.email.email_service import send_email
+from src.auth.verification_tokens import hash_verification_token, new_verification_token
+from src.cache.single_flight import SingleFlight
+from src.container import container
+from src.database.db import read_sessionmanager
+from src.email.email_outbox_repository import EmailOutboxRepository
+from src.features.contacts.cursor import decode_cursor, encode_cursor
+from src.features.contacts.schema.contact_filter_schema import ContactFilterModel
 from src.features.contacts.schema.contact_update_schema import ContactUpdateModel
+from src.storage.gravatar import gravatar_url
 from src.config import settings
 
+# Shared by concurrent GET /contacts/{id} requests for the same contact.
+contact_lookups = SingleFlight()
+
 
 class ContactsService:
     def __init__(self, db: AsyncSession):
         self.contacts_repository = ContactsRepository(db)
+        self.email_outbox_repository = EmailOutboxRepository(db)
+
+    async def get_contacts(
+        self,
+        skip: int,
+        limit: int,
+        include_data: bool = False,
+        filters: ContactFilterModel | None = None,
+        sort: str | None = None,
+    ):
+        try:
+            order_by = parse_sort(sort)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return await self.contacts_repository.get_contacts(
+            skip, limit, include_data, filters, order_by
+        )
+
+    async def count_contacts(
+        self, filters: ContactFilterModel | None = None
+    ) -> tuple[int, bool]:
+        return await self.contacts_repository.count_contacts(filters)
+
+    async def get_contacts_page(
+        self,
+        cursor: str,
+        limit: int,
+        include_data: bool = False,
+        filters: ContactFilterModel | None = None,
+    ):
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
 
-    async def get_contacts(self, skip: int, limit: int):
-        return await self.contacts_repository.get_contacts(skip, limit)
+        contacts = await self.contacts_repository.get_contacts_after(
+            after_id, limit, include_data, filters
+        )
+        next_cursor = None
+        if contacts and len(contacts) == limit:
+            next_cursor = encode_cursor(contacts[-1]["id"])
+
+        return contacts, next_cursor
+
+    @staticmethod
+    async def get_contact_by_id(contact_id: int, include_data: bool = False):
+        """Concurrent lookups of one id share a single query.
+
+        The shared query runs on its own read session, so callers don't need one.
+        """
 
-    async def get_contact_by_id(self, contact_id: int):
-        contact = await self.contacts_repository.get_contact_by_id(contact_id)
+        async def load():
+            async with read_sessionmanager.session() as session:
+                return await ContactsRepository(session).get_contact_row(
+                    contact_id, include_data
+                )
+
+        contact = await contact_lookups.run((contact_id, include_data), load)
 
         if not contact:
             raise HTTPException(
                 detail="Contact not found", status_code=status.HTTP_404_NOT_FOUND
             )
 
-        return contact
+        return dict(contact)
+
+    @staticmethod
+    async def get_avatar_source(contact_id: int) -> str:
+        contact = await ContactsService.get_contact_by_id(contact_id)
+
+        return contact["avatar"] or gravatar_url(contact["email"])
+
+    async def get_contacts_batch(
+        self,
+        ids: list[int] | None = None,
+        emails: list[str] | None = None,
+        include_data: bool = False,
+    ) -> dict:
+        """Resolve all keys with one query; results follow the request order."""
+        if ids is not None:
+            keys, field = ids, "id"
+            rows = await self.contacts_repository.get_contacts_by_ids(
+                list(set(ids)), include_data
+            )
+        else:
+            keys, field = emails, "email"
+            rows = await self.contacts_repository.get_contacts_by_emails(
+                list(set(emails)), include_data
+            )
 
-    async def create_contact(self, body: ContactModel):
-        existing_contact = await self.contacts_repository.get_contact_by_email(
-            body.email
-        )
+        found = {row[field]: dict(row) for row in rows}
 
-        if existing_contact:
+        return {
+            "results": [
+                {"key": key, "found": key in found, "contact": found.get(key)}
+                for key in keys
+            ]
+        }
+
+    async def create_contact(self, body: ContactModel):
+        # Reject known emails before paying for bcrypt; ON CONFLICT below still
+        # covers two signups racing for the same address.
+        if await self.contacts_repository.email_exists(body.email):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT, detail="Contact already exists"
             )
 
-        password_hash = Hash().get_password_hash(body.password)
+        password_hash = await container.hash.get_password_hash_async(body.password)
         body.password = password_hash
 
-        g = Gravatar(body.email)
-        body.avatar = g.get_image()
+        body.avatar = gravatar_url(body.email)
 
-        contact = await self.contacts_repository.create_contact(body)
-
-        await send_email(
-            contact.email,
+        # The welcome email is staged first and committed together with the
+        # contact and its token, so a signup never exists without its email.
+        token, expires_at = new_verification_token()
+        await self.email_outbox_repository.enqueue(
+            body.email,
             "Welcome to Contacts",
             "verify_email.html",
-            {
-                "token": contact.verification_token,
-                "host": settings.HOST,
-                "first_name": contact.first_name,
-            },
+            {"token": token, "host": settings.HOST, "first_name": body.first_name},
+            commit=False,
+        )
+
+        contact = await self.contacts_repository.create_contact(
+            body, hash_verification_token(token), expires_at
         )
 
+        if not contact:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Contact already exists"
+            )
+
         return contact
 
     async def update_contact(self, contact_id: int, body: ContactUpdateModel):
@@ -66,22 +166,33 @@ class ContactsService:
         return await self.contacts_repository.delete_contact(contact_id)
 
     async def search(
-        self, first_name: str | None, last_name: str | None, email: str | None
+        self,
+        first_name: str | None,
+        last_name: str | None,
+        email: str | None,
+        query: str | None = None,
+        skip: int = 0,
+        limit: int = 10,
+        include_data: bool = False,
+        data: dict | None = None,
     ):
-        if not first_name and not last_name and not email:
+        if query:
+            return await self.contacts_repository.search_contact_fuzzy(
+                query, skip, limit, include_data, data
+            )
+
+        if not first_name and not last_name and not email and not data:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="No search parameters provided",
             )
 
         return await self.contacts_repository.search_contact(
-            first_name, last_name, email
+            first_name, last_name, email, skip, limit, include_data, data
         )
 
-    async def soon_celebrate(self, days: int = 7):
-        return await self.contacts_repository.bd_soon(days)
+    async def soon_celebrate(self, days: int = 7, include_data: bool = False):
+        return await self.contacts_repository.bd_soon(days, include_data)
 
     async def update_avatar_url(self, contact_id, avatar_url):
-        await self.contacts_repository.update_avatar_url(contact_id, avatar_url)
-
-        return await self.contacts_repository.get_contact_by_id(contact_id)
+        return await self.contacts_repository.update_avatar_url(contact_id, avatar_url)
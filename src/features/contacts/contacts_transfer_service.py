@@ -0,0 +1,184 @@
+import codecs
+import csv
+import io
+import json
+import secrets
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.auth.contacts_repository import ContactsRepository
+from src.config import settings
+from src.container import container
+from src.database.db import read_sessionmanager
+from src.features.contacts.schema.contact_import_schema import ContactImportModel
+
+EXPORT_FIELDS = [
+    "id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "birth_day",
+    "avatar",
+    "data",
+]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+# Record iterators yield a dict per row, or the parse error of a malformed row so
+# the import can report it and carry on with the next one.
+async def iter_csv_records(
+    lines: AsyncIterator[str],
+) -> AsyncIterator[dict | Exception]:
+    header = None
+    record = ""
+    async for line in lines:
+        record = f"{record}\n{line}" if record else line
+        # A quoted field spans lines until its quotes are balanced.
+        if record.count('"') % 2:
+            continue
+
+        try:
+            values = next(csv.reader([record]), [])
+        except csv.Error as err:
+            record = ""
+            yield err
+            continue
+        record = ""
+        if not values:
+            continue
+        if header is None:
+            header = values
+            continue
+
+        row = dict(zip(header, values))
+        if row.get("data"):
+            try:
+                row["data"] = json.loads(row["data"])
+            except ValueError:
+                pass  # left as a string, rejected by row validation
+        yield {key: value for key, value in row.items() if value != ""}
+
+    if record:
+        yield ValueError("unterminated quoted field")
+
+
+async def iter_ndjson_records(
+    lines: AsyncIterator[str],
+) -> AsyncIterator[dict | Exception]:
+    async for line in lines:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError as err:
+                yield err
+
+
+class ContactsTransferService:
+    def __init__(self, db: AsyncSession):
+        self.contacts_repository = ContactsRepository(db)
+
+    async def import_contacts(self, chunks: AsyncIterator[bytes], content_type: str):
+        if content_type.startswith("text/csv"):
+            records = iter_csv_records(iter_lines(chunks))
+        elif content_type.startswith(("application/x-ndjson", "application/jsonl")):
+            records = iter_ndjson_records(iter_lines(chunks))
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Expected text/csv or application/x-ndjson",
+            )
+
+        # Imported contacts are not verified and cannot log in; they all share a
+        # hash of a random secret so only one bcrypt call is made per import.
+        password = await container.hash.get_password_hash_async(
+            secrets.token_urlsafe(32)
+        )
+
+        result = {"imported": 0, "failed": 0, "errors": []}
+        batch: list[tuple[int, dict]] = []
+        row_number = 0
+
+        async def flush():
+            inserted = await self.contacts_repository.create_contacts_bulk(
+                [values for _, values in batch]
+            )
+            for number, values in batch:
+                if values["email"] in inserted:
+                    inserted.discard(values["email"])
+                    result["imported"] += 1
+                else:
+                    self._add_error(result, number, "Contact already exists")
+            batch.clear()
+
+        try:
+            async for record in records:
+                row_number += 1
+                if isinstance(record, Exception):
+                    self._add_error(result, row_number, f"Malformed input: {record}")
+                    continue
+                try:
+                    contact = ContactImportModel.model_validate(record)
+                except ValidationError as err:
+                    self._add_error(result, row_number, str(err.errors()[0]["msg"]))
+                    continue
+
+                batch.append(
+                    (row_number, {**contact.model_dump(), "password": password})
+                )
+                if len(batch) >= settings.CONTACTS_IMPORT_BATCH_SIZE:
+                    await flush()
+        except UnicodeDecodeError as err:
+            # Undecodable bytes leave no reliable line boundaries to resume from.
+            self._add_error(result, row_number + 1, f"Malformed input: {err}")
+
+        if batch:
+            await flush()
+
+        return result
+
+    @staticmethod
+    def _add_error(result: dict, row: int, error: str):
+        result["failed"] += 1
+        if len(result["errors"]) < settings.CONTACTS_IMPORT_MAX_ERRORS:
+            result["errors"].append({"row": row, "error": error})
+
+    @staticmethod
+    async def export_contacts(export_format: str) -> AsyncIterator[str]:
+        # The request-scoped session is closed before a streaming response is sent,
+        # so the export opens its own session for the lifetime of the stream.
+        async with read_sessionmanager.session() as session:
+            rows = ContactsRepository(session).stream_contacts(
+                settings.CONTACTS_EXPORT_BATCH_SIZE
+            )
+
+            if export_format == "csv":
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+                writer.writeheader()
+                async for row in rows:
+                    writer.writerow({**row, "data": json.dumps(row["data"])})
+                    if buffer.tell() >= 64 * 1024:
+                        yield buffer.getvalue()
+                        buffer.seek(0)
+                        buffer.truncate()
+                yield buffer.getvalue()
+            else:
+                async for row in rows:
+                    yield json.dumps(row, default=str) + "\n"
@@ -0,0 +1,17 @@
+import base64
+import binascii
+
+
+def encode_cursor(contact_id: int) -> str:
+    return base64.urlsafe_b64encode(str(contact_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int | None:
+    if not cursor:
+        return None
+
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
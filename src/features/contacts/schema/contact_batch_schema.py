@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field, model_validator
+
+from src.config import settings
+from src.features.contacts.schema.contact_response_schema import ContactResponseModel
+
+
+class ContactBatchRequestModel(BaseModel):
+    ids: list[int] | None = None
+    emails: list[str] | None = None
+
+    @model_validator(mode="after")
+    def check_keys(self):
+        if (self.ids is None) == (self.emails is None):
+            raise ValueError("Pass either ids or emails")
+
+        keys = self.ids if self.ids is not None else self.emails
+        if len(keys) > settings.CONTACTS_BATCH_MAX_KEYS:
+            raise ValueError(
+                f"At most {settings.CONTACTS_BATCH_MAX_KEYS} keys per request"
+            )
+
+        return self
+
+
+class ContactBatchItemModel(BaseModel):
+    key: int | str
+    found: bool
+    contact: ContactResponseModel | None = None
+
+
+class ContactBatchResponseModel(BaseModel):
+    results: list[ContactBatchItemModel] = Field(default_factory=list)
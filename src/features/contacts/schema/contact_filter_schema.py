@@ -0,0 +1,85 @@
+import json
+import math
+from datetime import datetime
+from typing import Iterable
+
+from pydantic import BaseModel, Field
+
+DATA_FILTER_PREFIX = "data."
+
+
+class ContactFilterModel(BaseModel):
+    verified: bool | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    name: str | None = Field(None, min_length=1, max_length=50)
+    # Matched with JSONB containment (`data @> ...`)
+    data: dict | None = None
+
+    def is_empty(self) -> bool:
+        return all(value is None for value in self.model_dump().values())
+
+
+class _NonFiniteNumber(Exception):
+    pass
+
+
+def _reject_non_finite(raw: str):
+    raise _NonFiniteNumber(raw)
+
+
+def _finite_float(raw: str) -> float:
+    value = float(raw)
+    if not math.isfinite(value):
+        raise _NonFiniteNumber(raw)
+    return value
+
+
+def parse_filter_value(raw: str):
+    """JSON value of a filter param, or the raw string if it is not JSON.
+
+    NaN and infinities are not valid JSON for Postgres, so they are rejected.
+    """
+    try:
+        return json.loads(
+            raw, parse_constant=_reject_non_finite, parse_float=_finite_float
+        )
+    except _NonFiniteNumber:
+        raise ValueError(
+            f"Non-finite numbers are not allowed in data filters: {raw}"
+        ) from None
+    except ValueError:
+        return raw
+
+
+def parse_data_filter(params: Iterable[tuple[str, str]]) -> dict | None:
+    """Build a containment document from `data.<path>=<value>` query params.
+
+    `data.address.city=Kyiv` becomes {"address": {"city": "Kyiv"}}. Values
+    that parse as JSON (numbers, booleans, quoted strings) keep their JSON
+    type; anything else is matched as a string. So `data.phone=123` only
+    matches the number 123; quote it (`data.phone="123"`) to match a value
+    stored as a string.
+    """
+    document = {}
+
+    for key, raw in params:
+        if not key.startswith(DATA_FILTER_PREFIX):
+            continue
+
+        path = key[len(DATA_FILTER_PREFIX) :].split(".")
+        if not all(path):
+            raise ValueError(f"Invalid data filter: {key}")
+
+        node = document
+        for segment in path[:-1]:
+            node = node.setdefault(segment, {})
+            if not isinstance(node, dict):
+                raise ValueError(f"Conflicting data filters for {key}")
+
+        if isinstance(node.get(path[-1]), dict):
+            raise ValueError(f"Conflicting data filters for {key}")
+
+        node[path[-1]] = parse_filter_value(raw)
+
+    return document or None
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class ContactImportErrorModel(BaseModel):
+    row: int
+    error: str
+
+
+class ContactImportResponseModel(BaseModel):
+    imported: int
+    failed: int
+    errors: list[ContactImportErrorModel]
@@ -0,0 +1,18 @@
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class ContactImportModel(BaseModel):
+    """One imported row. Unknown columns, including `avatar`, are ignored.
+
+    The avatar is never taken from input: contacts without one are served
+    their Gravatar, so an import cannot point the avatar proxy at other hosts.
+    """
+
+    first_name: str = Field(max_length=50)
+    last_name: str = Field(max_length=50)
+    email: str = Field(max_length=120)
+    phone: str = Field(max_length=12)
+    birth_day: date
+    data: dict | None = None
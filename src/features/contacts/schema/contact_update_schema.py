@@ -1,7 +1,21 @@
 from datetime import date
-from typing import Optional
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from src.database.jsonb import parse_pointer
+
+
+class DataOperationModel(BaseModel):
+    op: Literal["set", "remove"]
+    path: str = Field(min_length=2)
+    value: Any = None
+
+    @field_validator("path")
+    @classmethod
+    def check_path(cls, path: str) -> str:
+        parse_pointer(path)
+        return path
 
 
 class ContactUpdateModel(BaseModel):
@@ -9,4 +23,16 @@ class ContactUpdateModel(BaseModel):
     last_name: Optional[str] = Field(None, max_length=50)
     phone: Optional[str] = Field(None, max_length=12)
     birth_day: Optional[date] = None
+    # `data` replaces the whole document; `data_patch` is a JSON merge patch
+    # (RFC 7386) and `data_ops` sets or removes values at JSON pointers.
     data: Optional[dict] = None
+    data_patch: Optional[dict] = None
+    data_ops: Optional[list[DataOperationModel]] = None
+
+    @model_validator(mode="after")
+    def check_data_fields(self):
+        given = [self.data, self.data_patch, self.data_ops]
+        if sum(value is not None for value in given) > 1:
+            raise ValueError("Use only one of data, data_patch and data_ops")
+
+        return self
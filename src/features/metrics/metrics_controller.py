@@ -0,0 +1,94 @@
+import secrets
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.auth.hash import hash_executor
+from src.auth.login_guard import login_guard
+from src.auth.refresh_tokens import refresh_tokens
+from src.auth.tokens import token_cache
+from src.auth.user_cache import user_cache
+from src.cache.response_cache import response_cache
+from src.config import settings
+from src.container import container
+from src.database.db import sessionmanager, read_sessionmanager
+from src.features.contacts.contacts_service import contact_lookups
+from src.metrics.registry import registry
+from src.rate_limit.rate_limiter import rate_limiter
+
+metrics_bearer = HTTPBearer(auto_error=False)
+
+
+async def require_metrics_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(metrics_bearer),
+):
+    """Metrics expose internals, so they are only served to holders of METRICS_TOKEN."""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(
+    prefix="/metrics", tags=["metrics"], dependencies=[Depends(require_metrics_token)]
+)
+prometheus_router = APIRouter(
+    tags=["metrics"], dependencies=[Depends(require_metrics_token)]
+)
+
+
+def collect_stats() -> dict:
+    return {
+        "db_pool": sessionmanager.pool_stats(),
+        "db_replicas": read_sessionmanager.replica_stats(),
+        "user_cache": user_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "response_cache": response_cache.stats(),
+        "hash_executor": hash_executor.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "login_guard": login_guard.stats(),
+        "refresh_tokens": refresh_tokens.stats(),
+        "contact_lookups": contact_lookups.stats(),
+        "avatar_proxy": container.avatar_proxy.stats(),
+    }
+
+
+def flatten_stats(value, prefix: str = ""):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from flatten_stats(item, f"{prefix}_{key}" if prefix else key)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from flatten_stats(item, f"{prefix}_{index}")
+    else:
+        yield prefix, float(value)
+
+
+@router.get("/")
+async def metrics():
+    return collect_stats()
+
+
+@prometheus_router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    lines = [
+        "# HELP app_component_stat Counters and gauges reported by app components.",
+        "# TYPE app_component_stat gauge",
+    ]
+    for component, stats in collect_stats().items():
+        for stat, value in flatten_stats(stats):
+            lines.append(
+                f'app_component_stat{{component="{component}",stat="{stat}"}} {value}'
+            )
+
+    return PlainTextResponse(
+        registry.render() + "\n".join(lines) + "\n",
+        media_type="text/plain; version=0.0.4",
+    )
@@ -0,0 +1,150 @@
+import contextlib
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from src.config import settings
+from src.metrics.profiler import StackSampler
+from src.metrics.registry import Counter, Gauge, Histogram, registry
+
+logger = logging.getLogger(__name__)
+
+REQUEST_LATENCY = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Request latency until the response starts.",
+        ("method", "route", "status"),
+    )
+)
+REQUESTS_IN_FLIGHT = registry.register(
+    Gauge("http_requests_in_flight", "Requests currently being handled.")
+)
+REQUEST_DB_SECONDS = registry.register(
+    Histogram(
+        "http_request_db_seconds", "Time spent in SQL per request.", ("route",)
+    )
+)
+REQUEST_DB_QUERIES = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL statements issued per request.",
+        ("route",),
+        buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+    )
+)
+DB_QUERY_SECONDS = registry.register(
+    Histogram("db_query_duration_seconds", "Duration of single SQL statements.")
+)
+EXTERNAL_CALL_SECONDS = registry.register(
+    Histogram(
+        "external_call_duration_seconds",
+        "Time spent in bcrypt, SMTP and avatar storage calls.",
+        ("service",),
+    )
+)
+SLOW_REQUESTS = registry.register(
+    Counter("http_slow_requests_total", "Requests over the profiling threshold.")
+)
+
+
+@dataclass
+class RequestStats:
+    db_seconds: float = 0.0
+    queries: int = 0
+    external_seconds: dict[str, float] = field(default_factory=dict)
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+@contextlib.asynccontextmanager
+async def track_external(service: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        EXTERNAL_CALL_SECONDS.observe(service, value=elapsed)
+        stats = request_stats.get()
+        if stats is not None:
+            stats.external_seconds[service] = (
+                stats.external_seconds.get(service, 0.0) + elapsed
+            )
+
+
+def instrument_engine(engine: AsyncEngine):
+    # SQLAlchemy runs these hooks in a greenlet that shares the caller's context,
+    # so request_stats resolves to the request that issued the statement.
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        DB_QUERY_SECONDS.observe(value=elapsed)
+        stats = request_stats.get()
+        if stats is not None:
+            stats.db_seconds += elapsed
+            stats.queries += 1
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        sampler = None
+        if settings.PROFILE_SLOW_REQUEST_MS and (
+            random.random() < settings.PROFILE_SAMPLE_RATE
+        ):
+            sampler = StackSampler(
+                threading.get_ident(), settings.PROFILE_INTERVAL_MS / 1000
+            )
+            sampler.start()
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+
+            route = request.scope.get("route")
+            route_path = route.path if route is not None else "unmatched"
+            REQUEST_LATENCY.observe(
+                request.method, route_path, status_code, value=elapsed
+            )
+            REQUEST_DB_SECONDS.observe(route_path, value=stats.db_seconds)
+            REQUEST_DB_QUERIES.observe(route_path, value=stats.queries)
+
+            if sampler is not None:
+                stacks = sampler.stop()
+                if elapsed * 1000 >= settings.PROFILE_SLOW_REQUEST_MS:
+                    SLOW_REQUESTS.inc()
+                    logger.warning(
+                        "Slow request %s %s took %.0f ms (db %.0f ms, %d queries,"
+                        " external %s)\n%s",
+                        request.method,
+                        route_path,
+                        elapsed * 1000,
+                        stats.db_seconds * 1000,
+                        stats.queries,
+                        stats.external_seconds,
+                        sampler.format(stacks),
+                    )
+
+            request_stats.reset(token)
@@ -0,0 +1,49 @@
+import sys
+import threading
+import traceback
+from collections import Counter
+
+
+class StackSampler:
+    """Samples one thread's stack from a background thread.
+
+    Pointed at the event loop thread, it shows what the loop was executing
+    (including blocking calls) while a slow request was in flight.
+    """
+
+    def __init__(self, thread_id: int, interval: float, max_depth: int = 20):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.max_depth = max_depth
+        self._stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        self._stopped.set()
+        self._thread.join()
+        return self._stacks
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            summary = traceback.extract_stack(frame, limit=self.max_depth)
+            stack = " <- ".join(
+                f"{entry.name} ({entry.filename}:{entry.lineno})"
+                for entry in reversed(summary)
+            )
+            self._stacks[stack] += 1
+
+    @staticmethod
+    def format(stacks: Counter[str], top: int = 5) -> str:
+        total = sum(stacks.values())
+        if not total:
+            return "no samples"
+        return "\n".join(
+            f"{count / total:6.1%} {stack}" for stack, count in stacks.most_common(top)
+        )
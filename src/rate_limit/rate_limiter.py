@@ -0,0 +1,137 @@
+import math
+import time
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from jose import JWTError
+from limits import parse
+from limits.aio.storage import MemoryStorage
+from limits.storage import storage_from_string
+from limits.aio.strategies import MovingWindowRateLimiter
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.auth.tokens import decode_token
+from src.config import settings
+
+
+def create_limits_storage(uri: str):
+    """`limits` storage for a URI, shared by the rate limiter and the auth guards.
+
+    Async Redis URIs use redis-py (the `redis` extra) rather than limits' default
+    coredis client.
+    """
+    if uri.startswith("async+redis"):
+        return storage_from_string(uri, implementation="redispy")
+    return storage_from_string(uri)
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+
+
+def client_key(request: Request) -> str:
+    """The verified access token's subject, client IP otherwise.
+
+    Only a token that passes signature and expiry checks selects a per-user
+    bucket; anything else would let a client mint a fresh bucket per request.
+    """
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            subject = decode_token(token).get("sub")
+        except JWTError:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+
+    return "ip:" + (request.client.host if request.client else "unknown")
+
+
+class RateLimiter:
+    """Moving-window limits over a shared `limits` storage (e.g. async+redis://).
+
+    A per-process moving window with the same limits runs first: hits seen by one
+    worker are a subset of the global count, so a local rejection is always
+    correct and saves a round trip to the shared store.
+    """
+
+    def __init__(self, storage_uri: str, policies: dict[str, str]):
+        storage = create_limits_storage(storage_uri)
+        self.limiter = MovingWindowRateLimiter(storage)
+        self.local = (
+            None
+            if isinstance(storage, MemoryStorage)
+            else MovingWindowRateLimiter(MemoryStorage())
+        )
+        self.policies = {name: parse(value) for name, value in policies.items()}
+        self.local_rejections = 0
+        self.remote_checks = 0
+        self.rejections = 0
+
+    async def check(self, policy: str, key: str):
+        limit = self.policies.get(policy)
+        if limit is None:
+            return
+
+        if self.local is not None and not await self.local.hit(limit, policy, key):
+            self.local_rejections += 1
+            self.rejections += 1
+            raise RateLimitError(
+                await self._retry_after(self.local, limit, policy, key)
+            )
+
+        self.remote_checks += 1
+        if not await self.limiter.hit(limit, policy, key):
+            self.rejections += 1
+            raise RateLimitError(
+                await self._retry_after(self.limiter, limit, policy, key)
+            )
+
+    @staticmethod
+    async def _retry_after(limiter, limit, policy: str, key: str) -> int:
+        stats = await limiter.get_window_stats(limit, policy, key)
+        return max(1, math.ceil(stats.reset_time - time.time()))
+
+    def stats(self) -> dict:
+        return {
+            "remote_checks": self.remote_checks,
+            "local_rejections": self.local_rejections,
+            "rejections": self.rejections,
+        }
+
+
+rate_limiter = RateLimiter(
+    settings.RATE_LIMIT_STORAGE_URI, settings.RATE_LIMIT_POLICIES
+)
+
+
+def rate_limit(policy: str):
+    """Route dependency enforcing the named policy from RATE_LIMIT_POLICIES."""
+
+    async def dependency(request: Request):
+        if settings.RATE_LIMIT_ENABLED:
+            await rate_limiter.check(policy, client_key(request))
+
+    return dependency
+
+
+def rate_limit_response(retry_after: int) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={"error": "rate limit exceeded. Try again later"},
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """Applies the `default` policy to every request."""
+
+    async def dispatch(self, request: Request, call_next):
+        try:
+            await rate_limiter.check("default", client_key(request))
+        except RateLimitError as err:
+            return rate_limit_response(err.retry_after)
+
+        return await call_next(request)
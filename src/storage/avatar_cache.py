@@ -0,0 +1,132 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+
+from src.storage.avatar_upload_service import SIGNATURES
+
+# Temp files older than this were left by a crashed write, not one in progress.
+ORPHAN_TMP_AGE_SECONDS = 300
+
+
+@dataclass
+class AvatarEntry:
+    body: bytes
+    content_type: str
+    etag: str
+    last_modified: datetime
+    fetched_at: float
+
+
+def sniff_content_type(head: bytes) -> str:
+    for content_type, signatures in SIGNATURES.items():
+        if head.startswith(signatures):
+            return content_type
+    return "application/octet-stream"
+
+
+class AvatarDiskCache:
+    """Size-bounded on-disk LRU of avatar images, keyed by source URL.
+
+    Recency is tracked in memory and rebuilt from file mtimes on first use, so
+    after a restart the oldest fetched files are evicted first. Methods do
+    blocking file IO; call them from a thread. The index, the byte count,
+    renames into the cache and reads of entry bodies are guarded by one lock,
+    so a concurrent put() cannot evict a file while it is being served.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._sizes: OrderedDict[str, int] | None = None
+        self.total_bytes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _index(self) -> OrderedDict[str, int]:
+        """The LRU index; callers hold the lock."""
+        if self._sizes is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            files = []
+            for entry in os.scandir(self.directory):
+                if not entry.is_file():
+                    continue
+                if not entry.name.startswith("."):
+                    files.append(entry)
+                elif time.time() - entry.stat().st_mtime > ORPHAN_TMP_AGE_SECONDS:
+                    Path(entry.path).unlink(missing_ok=True)
+            files.sort(key=lambda entry: entry.stat().st_mtime)
+            self._sizes = OrderedDict(
+                (entry.name, entry.stat().st_size) for entry in files
+            )
+            self.total_bytes = sum(self._sizes.values())
+        return self._sizes
+
+    def get(self, url: str) -> AvatarEntry | None:
+        with self._lock:
+            return self._entry(self.key(url))
+
+    def _entry(self, key: str) -> AvatarEntry | None:
+        sizes = self._index()
+        if key not in sizes:
+            return None
+
+        try:
+            with open(self.directory / key, "rb") as file:
+                stat = os.fstat(file.fileno())
+                body = file.read()
+        except FileNotFoundError:
+            self.total_bytes -= sizes.pop(key, 0)
+            return None
+
+        sizes.move_to_end(key)
+        return AvatarEntry(
+            body=body,
+            content_type=sniff_content_type(body[:16]),
+            etag=f'"{key[:16]}-{int(stat.st_mtime)}"',
+            last_modified=datetime.fromtimestamp(int(stat.st_mtime), UTC),
+            fetched_at=stat.st_mtime,
+        )
+
+    def put(self, url: str, body: bytes) -> AvatarEntry:
+        key = self.key(url)
+        with self._lock:
+            self._index()
+
+        # Write to a temp file and rename so readers never see partial images.
+        fd, tmp_path = tempfile.mkstemp(prefix=".", dir=self.directory)
+        with os.fdopen(fd, "wb") as file:
+            file.write(body)
+
+        with self._lock:
+            os.replace(tmp_path, self.directory / key)
+            sizes = self._index()
+            self.total_bytes += len(body) - sizes.pop(key, 0)
+            sizes[key] = len(body)
+            self._evict()
+
+            return self._entry(key)
+
+    def _evict(self):
+        sizes = self._index()
+        while self.total_bytes > self.max_bytes and len(sizes) > 1:
+            key, size = sizes.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            (self.directory / key).unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._sizes or ()),
+            "bytes": self.total_bytes,
+            "evictions": self.evictions,
+        }
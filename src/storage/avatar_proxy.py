@@ -0,0 +1,130 @@
+import asyncio
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from email.utils import format_datetime
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from src.cache.response_cache import is_not_modified
+from src.cache.single_flight import SingleFlight
+from src.config import settings
+from src.metrics.instrumentation import track_external
+from src.storage.avatar_cache import AvatarDiskCache, AvatarEntry
+
+
+class AvatarFetchError(Exception):
+    pass
+
+
+GRAVATAR_HOST = "www.gravatar.com"
+CLOUDINARY_HOST = "res.cloudinary.com"
+
+
+def is_proxied_avatar(url: str) -> bool:
+    """Only Gravatar and our own Cloudinary account are fetched server-side."""
+    parts = urllib.parse.urlsplit(url)
+    try:
+        port = parts.port
+    except ValueError:
+        return False
+
+    if parts.scheme != "https" or port is not None or parts.username is not None:
+        return False
+    if parts.hostname == GRAVATAR_HOST:
+        return parts.path.startswith("/avatar/")
+    if parts.hostname == CLOUDINARY_HOST:
+        return parts.path.startswith(f"/{settings.CLOUDINARY_NAME}/")
+
+    return False
+
+
+class AllowListedRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Follows a redirect only if its target passes `is_proxied_avatar` too."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        if not is_proxied_avatar(newurl):
+            raise AvatarFetchError(f"Redirect to a disallowed URL: {newurl}")
+
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+opener = urllib.request.build_opener(AllowListedRedirectHandler)
+
+
+def fetch_image(url: str, max_bytes: int, timeout: float) -> bytes:
+    if not is_proxied_avatar(url):
+        raise AvatarFetchError(f"Not an allowed avatar URL: {url}")
+
+    request = urllib.request.Request(url, headers={"User-Agent": "contacts-app"})
+    try:
+        with opener.open(request, timeout=timeout) as response:
+            if not response.headers.get_content_type().startswith("image/"):
+                raise AvatarFetchError(f"Not an image: {url}")
+            body = response.read(max_bytes + 1)
+    except (urllib.error.URLError, OSError) as err:
+        raise AvatarFetchError(str(err)) from err
+
+    if len(body) > max_bytes:
+        raise AvatarFetchError(f"Avatar too large: {url}")
+
+    return body
+
+
+class AvatarProxy:
+    """Serves remote avatars (Gravatar, Cloudinary) from the local disk cache.
+
+    Entries older than `ttl` are refetched; if that fails the stale copy is
+    still served. Concurrent misses for one URL share a single fetch.
+    """
+
+    def __init__(self, cache: AvatarDiskCache, ttl: int):
+        self.cache = cache
+        self.ttl = ttl
+        self._fetches = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, url: str) -> AvatarEntry:
+        entry = await asyncio.to_thread(self.cache.get, url)
+
+        if entry is not None and time.time() - entry.fetched_at < self.ttl:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        try:
+            return await self._fetches.run(url, lambda: self._refresh(url))
+        except AvatarFetchError:
+            if entry is None:
+                raise
+            return entry
+
+    async def _refresh(self, url: str) -> AvatarEntry:
+        async with track_external("avatar_fetch"):
+            body = await asyncio.to_thread(
+                fetch_image,
+                url,
+                settings.AVATAR_MAX_BYTES,
+                settings.AVATAR_FETCH_TIMEOUT_SECONDS,
+            )
+
+        return await asyncio.to_thread(self.cache.put, url, body)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, **self.cache.stats()}
+
+
+def avatar_response(request: Request, entry: AvatarEntry) -> Response:
+    headers = {
+        "etag": entry.etag,
+        "last-modified": format_datetime(entry.last_modified, usegmt=True),
+        "cache-control": f"public, max-age={settings.AVATAR_CACHE_MAX_AGE_SECONDS}",
+    }
+
+    if is_not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+
+    return Response(entry.body, media_type=entry.content_type, headers=headers)
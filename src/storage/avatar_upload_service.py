@@ -0,0 +1,110 @@
+import asyncio
+import io
+import tempfile
+
+from fastapi import HTTPException, UploadFile, status
+
+from src.config import settings
+from src.metrics.instrumentation import track_external
+
+CHUNK_SIZE = 64 * 1024
+AVATAR_SIZE = (250, 250)
+
+# Leading bytes of the image formats we accept, checked against the first chunk.
+SIGNATURES = {
+    "image/jpeg": (b"\xff\xd8\xff",),
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/gif": (b"GIF87a", b"GIF89a"),
+    "image/webp": (b"RIFF",),
+}
+EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+
+def create_storage():
+    if settings.AVATAR_STORAGE == "local":
+        from src.storage.local_storage import LocalFileStorage
+
+        return LocalFileStorage(settings.AVATAR_LOCAL_DIR)
+
+    from src.cloudinary.upload_file_service import UploadFileService
+
+    return UploadFileService()
+
+
+def resize_image(file) -> io.BytesIO:
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(file) as image:
+            avatar = ImageOps.fit(image.convert("RGB"), AVATAR_SIZE)
+    except (OSError, Image.DecompressionBombError):
+        # Unreadable, truncated, or too many pixels to decode safely.
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid image"
+        )
+    output = io.BytesIO()
+    avatar.save(output, format="JPEG", quality=85, optimize=True)
+    output.seek(0)
+
+    return output
+
+
+class AvatarUploadService:
+    def __init__(self, storage, max_concurrency: int):
+        self.storage = storage
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload(self, file: UploadFile, username) -> str:
+        if file.content_type not in settings.AVATAR_ALLOWED_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Unsupported file type",
+            )
+
+        spooled = await self._spool(file)
+        try:
+            async with self._semaphore, track_external(settings.AVATAR_STORAGE):
+                return await asyncio.to_thread(
+                    self._process, spooled, username, file.content_type
+                )
+        finally:
+            spooled.close()
+
+    async def _spool(self, file: UploadFile):
+        """Copy the upload in chunks, rejecting it as soon as a limit is exceeded."""
+        spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        size = 0
+
+        while chunk := await file.read(CHUNK_SIZE):
+            signatures = SIGNATURES.get(file.content_type, (b"",))
+            if size == 0 and not chunk.startswith(signatures):
+                spooled.close()
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail="File content does not match its type",
+                )
+
+            size += len(chunk)
+            if size > settings.AVATAR_MAX_BYTES:
+                spooled.close()
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="File too large",
+                )
+
+            spooled.write(chunk)
+
+        spooled.seek(0)
+        return spooled
+
+    def _process(self, file, username, content_type: str) -> str:
+        if settings.AVATAR_RESIZE:
+            file = resize_image(file)
+            content_type = "image/jpeg"
+
+        return self.storage.upload_file(file, username, content_type)
@@ -0,0 +1,14 @@
+import hashlib
+from functools import lru_cache
+
+GRAVATAR_URL = "https://www.gravatar.com/avatar/"
+
+
+@lru_cache(maxsize=4096)
+def gravatar_hash(email: str) -> str:
+    return hashlib.md5(email.strip().lower().encode()).hexdigest()
+
+
+def gravatar_url(email: str) -> str:
+    """Gravatar image URL, computed locally; no request is made to Gravatar."""
+    return GRAVATAR_URL + gravatar_hash(email)
@@ -0,0 +1,25 @@
+import shutil
+from pathlib import Path
+
+from src.config import settings
+from src.storage.avatar_upload_service import EXTENSIONS
+
+
+class LocalFileStorage:
+    """Stores avatars on disk; served by the /avatars static mount."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def upload_file(self, file, username, content_type: str) -> str:
+        # The extension lets the static mount send the right Content-Type.
+        file_name = f"{username}{EXTENSIONS[content_type]}"
+        with open(self.directory / file_name, "wb") as destination:
+            shutil.copyfileobj(file, destination)
+
+        for stale in self.directory.glob(f"{username}.*"):
+            if stale.name != file_name:
+                stale.unlink(missing_ok=True)
+
+        return f"{settings.HOST}/avatars/{file_name}"
@@ -0,0 +1,52 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.storage.avatar_cache import ORPHAN_TMP_AGE_SECONDS, AvatarDiskCache
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 92
+
+
+def test_concurrent_gets_and_puts_keep_the_index_consistent(tmp_path):
+    cache = AvatarDiskCache(str(tmp_path), max_bytes=len(PNG) * 3)
+    urls = [f"https://example.com/{index}.png" for index in range(8)]
+
+    def exercise(index: int):
+        url = urls[index % len(urls)]
+        cache.put(url, PNG)
+        cache.get(urls[(index + 1) % len(urls)])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(exercise, range(400)))
+
+    on_disk = {path.name: path.stat().st_size for path in tmp_path.iterdir()}
+    assert on_disk == dict(cache._sizes)
+    assert cache.total_bytes == sum(on_disk.values()) <= cache.max_bytes
+
+
+def test_orphaned_temp_files_are_removed_on_first_use(tmp_path):
+    orphan = tmp_path / ".tmp-orphan"
+    orphan.write_bytes(b"partial")
+    stale = time.time() - ORPHAN_TMP_AGE_SECONDS - 1
+    os.utime(orphan, (stale, stale))
+    in_progress = tmp_path / ".tmp-in-progress"
+    in_progress.write_bytes(b"partial")
+
+    cache = AvatarDiskCache(str(tmp_path), max_bytes=1024)
+
+    assert cache.get("https://example.com/a.png") is None
+    assert not orphan.exists()
+    assert in_progress.exists()
+    assert cache.total_bytes == 0
+
+
+def test_entries_outlive_eviction_of_their_file(tmp_path):
+    cache = AvatarDiskCache(str(tmp_path), max_bytes=len(PNG))
+    cache.put("https://example.com/a.png", PNG)
+    entry = cache.get("https://example.com/a.png")
+
+    cache.put("https://example.com/b.png", PNG)
+
+    assert cache.get("https://example.com/a.png") is None
+    assert entry.body == PNG
+    assert entry.content_type == "image/png"
@@ -0,0 +1,119 @@
+import urllib.request
+
+import pytest
+from sqlalchemy import update
+
+from src.container import container
+from src.database.models.contacts_model import Contact
+from src.storage import avatar_proxy
+from src.storage.avatar_cache import AvatarDiskCache
+from src.storage.avatar_proxy import (
+    AllowListedRedirectHandler,
+    AvatarFetchError,
+    AvatarProxy,
+    is_proxied_avatar,
+)
+from tests.test_query_counts import signup
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 92
+
+
+@pytest.mark.parametrize(
+    "url, allowed",
+    [
+        ("https://www.gravatar.com/avatar/abc", True),
+        ("https://res.cloudinary.com/test/image/upload/v1/a.jpg", True),
+        ("https://res.cloudinary.com/other/image/upload/v1/a.jpg", False),
+        ("http://www.gravatar.com/avatar/abc", False),
+        ("https://www.gravatar.com:8443/avatar/abc", False),
+        ("https://user@www.gravatar.com/avatar/abc", False),
+        ("https://www.gravatar.com.evil.example/avatar/abc", False),
+        ("http://169.254.169.254/latest/meta-data", False),
+        ("https://localhost/avatar/abc", False),
+    ],
+)
+def test_only_allow_listed_urls_are_proxied(url, allowed):
+    assert is_proxied_avatar(url) is allowed
+
+
+def test_redirects_off_the_allow_list_are_refused():
+    handler = AllowListedRedirectHandler()
+    request = urllib.request.Request("https://www.gravatar.com/avatar/abc")
+
+    with pytest.raises(AvatarFetchError):
+        handler.redirect_request(
+            request, None, 302, "Found", {}, "http://127.0.0.1:8000/admin"
+        )
+
+    followed = handler.redirect_request(
+        request, None, 302, "Found", {}, "https://www.gravatar.com/avatar/def"
+    )
+    assert followed.full_url == "https://www.gravatar.com/avatar/def"
+
+
+@pytest.fixture
+def fetched(monkeypatch, tmp_path):
+    urls = []
+
+    def fetch_image(url, max_bytes, timeout):
+        urls.append(url)
+        return PNG
+
+    monkeypatch.setattr(avatar_proxy, "fetch_image", fetch_image)
+    monkeypatch.setitem(
+        container.__dict__,
+        "avatar_proxy",
+        AvatarProxy(AvatarDiskCache(str(tmp_path), 1024 * 1024), ttl=3600),
+    )
+    return urls
+
+
+async def set_avatar(database, contact_id: int, avatar: str):
+    async with database.session() as session:
+        await session.execute(
+            update(Contact).where(Contact.id == contact_id).values(avatar=avatar)
+        )
+        await session.commit()
+
+
+async def test_gravatar_is_proxied(client, fetched):
+    contact = await signup(client)
+
+    response = await client.get(f"/api/contacts/{contact['id']}/avatar")
+
+    assert response.status_code == 200
+    assert response.content == PNG
+    assert fetched == [contact["avatar"]]
+
+
+@pytest.mark.parametrize(
+    "avatar",
+    ["http://169.254.169.254/latest/meta-data", "https://evil.example/a.png"],
+)
+async def test_other_urls_are_neither_fetched_nor_redirected(
+    client, database, fetched, avatar
+):
+    contact = await signup(client)
+    await set_avatar(database, contact["id"], avatar)
+
+    response = await client.get(f"/api/contacts/{contact['id']}/avatar")
+
+    assert response.status_code == 404
+    assert fetched == []
+
+
+async def test_failed_fetch_is_not_redirected(client, monkeypatch, tmp_path):
+    def fetch_image(url, max_bytes, timeout):
+        raise AvatarFetchError("unreachable")
+
+    monkeypatch.setattr(avatar_proxy, "fetch_image", fetch_image)
+    monkeypatch.setitem(
+        container.__dict__,
+        "avatar_proxy",
+        AvatarProxy(AvatarDiskCache(str(tmp_path), 1024 * 1024), ttl=3600),
+    )
+    contact = await signup(client)
+
+    response = await client.get(f"/api/contacts/{contact['id']}/avatar")
+
+    assert response.status_code == 404
@@ -0,0 +1,30 @@
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.features.contacts.contacts_controller import data_filter
+from src.features.contacts.schema.contact_filter_schema import parse_data_filter
+
+
+def test_values_keep_their_json_type():
+    assert parse_data_filter(
+        [
+            ("data.address.city", "Kyiv"),
+            ("data.score", "1.5"),
+            ("data.phone", "123"),
+            ("data.code", '"123"'),
+            ("page", "2"),
+        ]
+    ) == {"address": {"city": "Kyiv"}, "score": 1.5, "phone": 123, "code": "123"}
+
+
+@pytest.mark.parametrize("raw", ["NaN", "Infinity", "-Infinity", "1e999", "[1, NaN]"])
+def test_non_finite_numbers_are_a_bad_request(raw):
+    request = Request(
+        {"type": "http", "query_string": f"data.x={raw}".encode(), "headers": []}
+    )
+
+    with pytest.raises(HTTPException) as error:
+        data_filter(request)
+
+    assert error.value.status_code == 400
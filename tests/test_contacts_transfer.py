@@ -0,0 +1,88 @@
+import json
+
+from src.auth.tokens import create_access_token
+from src.features.contacts.contacts_service import ContactsService
+from src.storage.gravatar import gravatar_url
+from tests.test_query_counts import SIGNUP, signup
+
+
+def auth_headers() -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': SIGNUP['email']})}"}
+
+
+def contact(email: str) -> dict:
+    return {
+        "first_name": "Grace",
+        "last_name": "Hopper",
+        "email": email,
+        "phone": "380501112233",
+        "birth_day": "1985-12-09",
+    }
+
+
+async def test_malformed_ndjson_line_fails_only_its_row(client):
+    await signup(client)
+    body = "\n".join(
+        [
+            json.dumps(contact("one@example.com")),
+            '{"first_name": "broken",',
+            json.dumps(contact("two@example.com")),
+        ]
+    )
+
+    response = await client.post(
+        "/api/contacts/import",
+        content=body,
+        headers={**auth_headers(), "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["imported"] == 2
+    assert result["failed"] == 1
+    assert result["errors"][0]["row"] == 2
+    assert result["errors"][0]["error"].startswith("Malformed input")
+
+
+async def test_unterminated_csv_quote_is_reported(client):
+    await signup(client)
+    body = 'first_name,last_name,email,phone,birth_day\n"Grace,Hopper,g@example.com'
+
+    response = await client.post(
+        "/api/contacts/import",
+        content=body,
+        headers={**auth_headers(), "Content-Type": "text/csv"},
+    )
+
+    assert response.json()["failed"] == 1
+
+
+async def test_export_requires_authentication(client):
+    await signup(client)
+
+    assert (await client.get("/api/contacts/export")).status_code == 401
+
+    response = await client.get("/api/contacts/export", headers=auth_headers())
+    assert response.status_code == 200
+    assert [json.loads(line)["email"] for line in response.text.splitlines()] == [
+        SIGNUP["email"]
+    ]
+
+
+async def test_imported_avatar_is_ignored(client):
+    await signup(client)
+    row = {**contact("g@example.com"), "avatar": "http://169.254.169.254/latest"}
+
+    response = await client.post(
+        "/api/contacts/import",
+        content=json.dumps(row),
+        headers={**auth_headers(), "Content-Type": "application/x-ndjson"},
+    )
+    assert response.json()["imported"] == 1
+
+    export = await client.get("/api/contacts/export", headers=auth_headers())
+    imported = [json.loads(line) for line in export.text.splitlines()][-1]
+    assert imported["avatar"] is None
+    assert await ContactsService.get_avatar_source(imported["id"]) == gravatar_url(
+        "g@example.com"
+    )
@@ -0,0 +1,161 @@
+import socket
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from aiosmtpd.controller import Controller
+from sqlalchemy import select, update
+
+from src.config import settings
+from src.database.models.email_outbox_model import EmailOutbox
+from src.email.email_outbox_repository import EmailOutboxRepository
+from src.email.email_worker import EmailOutboxWorker
+
+
+class CollectingHandler:
+    def __init__(self):
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = CollectingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    monkeypatch.setattr(settings, "MAIL_SERVER", "127.0.0.1")
+    monkeypatch.setattr(settings, "MAIL_PORT", port)
+    monkeypatch.setattr(settings, "MAIL_STARTTLS", False)
+    monkeypatch.setattr(settings, "MAIL_SSL_TLS", False)
+    monkeypatch.setattr(settings, "MAIL_USE_CREDENTIALS", False)
+    yield handler
+    controller.stop()
+
+
+@pytest.fixture
+async def worker():
+    worker = EmailOutboxWorker()
+    yield worker
+    await worker._disconnect()
+
+
+async def enqueue(database, recipient: str, template_name: str = "verify_email.html"):
+    async with database.session() as session:
+        await EmailOutboxRepository(session).enqueue(
+            recipient,
+            "Welcome to Contacts",
+            template_name,
+            {"token": "t", "host": "http://testserver", "first_name": "Ada"},
+        )
+
+
+async def outbox(database) -> dict[str, EmailOutbox]:
+    async with database.session() as session:
+        rows = (await session.execute(select(EmailOutbox))).scalars().all()
+    return {row.recipient: row for row in rows}
+
+
+async def test_sends_batch_over_smtp(database, smtp_server, worker):
+    for recipient in ("a@example.com", "b@example.com"):
+        await enqueue(database, recipient)
+
+    assert await worker.process_batch() == 2
+
+    assert [m.rcpt_tos for m in smtp_server.messages] == [
+        ["a@example.com"],
+        ["b@example.com"],
+    ]
+    assert b"Welcome to Contacts" in smtp_server.messages[0].content
+    rows = await outbox(database)
+    assert {row.status for row in rows.values()} == {EmailOutbox.STATUS_SENT}
+    assert await worker.process_batch() == 0
+
+
+async def test_sent_messages_drop_secrets(database, smtp_server, worker):
+    await enqueue(database, "a@example.com")
+
+    await worker.process_batch()
+
+    assert b"/api/auth/verify/t" in smtp_server.messages[0].content
+    row = (await outbox(database))["a@example.com"]
+    assert row.template_body == {"host": "http://testserver", "first_name": "Ada"}
+
+
+async def test_unrenderable_message_fails_alone(database, smtp_server, worker):
+    await enqueue(database, "a@example.com")
+    await enqueue(database, "broken@example.com", template_name="missing.html")
+    await enqueue(database, "b@example.com")
+
+    assert await worker.process_batch() == 2
+
+    rows = await outbox(database)
+    assert rows["a@example.com"].status == EmailOutbox.STATUS_SENT
+    assert rows["b@example.com"].status == EmailOutbox.STATUS_SENT
+    broken = rows["broken@example.com"]
+    assert broken.status == EmailOutbox.STATUS_PENDING
+    assert broken.attempts == 1
+    assert "missing.html" in broken.last_error
+    assert len(smtp_server.messages) == 2
+
+    # Retries never resend the messages that already went out.
+    assert await worker.process_batch() == 0
+    assert len(smtp_server.messages) == 2
+
+
+async def test_poison_message_is_dead_lettered(
+    database, smtp_server, worker, monkeypatch
+):
+    monkeypatch.setattr(settings, "EMAIL_MAX_ATTEMPTS", 2)
+    await enqueue(database, "broken@example.com", template_name="missing.html")
+
+    for _ in range(2):
+        await worker.process_batch()
+        async with database.session() as session:
+            await session.execute(
+                update(EmailOutbox).values(next_attempt_at=datetime.now(UTC))
+            )
+            await session.commit()
+
+    broken = (await outbox(database))["broken@example.com"]
+    assert broken.status == EmailOutbox.STATUS_DEAD
+    assert broken.attempts == 2
+    assert "token" not in broken.template_body
+
+
+async def test_purges_finished_messages(database, smtp_server, worker, monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_PURGE_BATCH_SIZE", 1)
+    for recipient in ("a@example.com", "b@example.com", "c@example.com"):
+        await enqueue(database, recipient)
+    await worker.process_batch()
+    await enqueue(database, "pending@example.com")
+
+    assert await worker.purge() == 0
+
+    async with database.session() as session:
+        await session.execute(
+            update(EmailOutbox).values(
+                created_at=datetime.now(UTC) - timedelta(days=30)
+            )
+        )
+        await session.commit()
+
+    assert await worker.purge() == 3
+    assert list(await outbox(database)) == ["pending@example.com"]
+
+
+async def test_claimed_messages_are_leased(database, smtp_server, worker):
+    await enqueue(database, "a@example.com")
+
+    async with database.session() as session:
+        claimed = await EmailOutboxRepository(session).claim_batch(10, lease=300)
+    assert [message.recipient for message in claimed] == ["a@example.com"]
+
+    # The claim is committed, so another worker skips the row until it expires.
+    assert await worker.process_batch() == 0
+    assert smtp_server.messages == []
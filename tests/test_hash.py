@@ -0,0 +1,31 @@
+import pytest
+
+from src.auth.hash import Hash, bcrypt_rounds, calibrate_bcrypt_rounds
+
+
+@pytest.fixture
+def restore_bcrypt_rounds():
+    rounds, min_rounds = bcrypt_rounds()
+    yield
+    Hash.pwd_context.update(bcrypt__rounds=rounds, bcrypt__min_rounds=min_rounds)
+    Hash._dummy_hash = None
+
+
+async def test_calibration_sets_rounds_used_by_the_hash_workers(
+    restore_bcrypt_rounds,
+):
+    # A tiny budget keeps the run short; calibration never goes below the minimum.
+    rounds = calibrate_bcrypt_rounds(target_ms=1, min_rounds=4, max_rounds=6)
+
+    assert rounds == 4
+    assert bcrypt_rounds() == (4, 4)
+    password_hash = await Hash().get_password_hash_async("secret")
+    assert password_hash.startswith("$2b$04$")
+    assert await Hash().verify_and_update_password("secret", password_hash) == (
+        True,
+        None,
+    )
+
+
+def test_calibration_picks_the_highest_cost_within_budget(restore_bcrypt_rounds):
+    assert calibrate_bcrypt_rounds(target_ms=5000, min_rounds=4, max_rounds=6) == 6
@@ -0,0 +1,135 @@
+"""Statement budgets for the write endpoints.
+
+Each test runs one request against a real Postgres (TEST_DB_URL) and counts
+the statements the app sends, so an extra SELECT shows up as a failure.
+"""
+
+from sqlalchemy import select
+
+from src.auth.tokens import create_access_token
+from src.container import container
+from src.database.models.email_outbox_model import EmailOutbox
+
+SIGNUP = {
+    "first_name": "Ada",
+    "last_name": "Lovelace",
+    "email": "ada@example.com",
+    "phone": "380501234567",
+    "birth_day": "1990-12-10",
+    "password": "correct-horse",
+}
+
+
+async def signup(client) -> dict:
+    response = await client.post("/api/contacts/signup", json=SIGNUP)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def verification_token(database) -> str:
+    async with database.session() as session:
+        stmt = select(EmailOutbox).order_by(EmailOutbox.id.desc()).limit(1)
+        message = (await session.execute(stmt)).scalar_one()
+    return message.template_body["token"]
+
+
+def auth_headers(email: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+
+async def test_signup(client, query_log):
+    await signup(client)
+
+    # existence check, outbox insert, contact insert, token insert
+    assert len(query_log) == 4, query_log
+
+
+async def test_duplicate_signup_skips_hashing(client, query_log, monkeypatch):
+    await signup(client)
+    query_log.clear()
+
+    async def fail(password):
+        raise AssertionError("duplicate signup must not hash the password")
+
+    monkeypatch.setattr(container.hash, "get_password_hash_async", fail)
+    response = await client.post("/api/contacts/signup", json=SIGNUP)
+
+    assert response.status_code == 409
+    assert len(query_log) == 1, query_log
+
+
+async def test_verify_email(client, database, query_log):
+    await signup(client)
+    token = await verification_token(database)
+    query_log.clear()
+
+    response = await client.get(f"/api/auth/verify/{token}")
+
+    assert response.status_code == 200, response.text
+    assert len(query_log) == 1, query_log
+
+
+async def test_resend_verification(client, database, query_log):
+    await signup(client)
+    old_token = await verification_token(database)
+    query_log.clear()
+
+    response = await client.post(
+        "/api/auth/verify/resend", json={"email": SIGNUP["email"]}
+    )
+
+    assert response.status_code == 202, response.text
+    # contact lookup, outbox insert, old token delete, new token insert
+    assert len(query_log) == 4, query_log
+
+    new_token = await verification_token(database)
+    assert (await client.get(f"/api/auth/verify/{old_token}")).status_code == 400
+    assert (await client.get(f"/api/auth/verify/{new_token}")).status_code == 200
+
+    # Verified and unknown addresses get the same answer and no email.
+    query_log.clear()
+    for email in (SIGNUP["email"], "nobody@example.com"):
+        response = await client.post("/api/auth/verify/resend", json={"email": email})
+        assert response.status_code == 202
+    assert len(query_log) == 2, query_log
+
+
+async def test_update_contact(client, query_log):
+    contact = await signup(client)
+    headers = auth_headers(SIGNUP["email"])
+    await client.get("/api/contacts/me", headers=headers)  # warm the user cache
+    query_log.clear()
+
+    response = await client.patch(
+        f"/api/contacts/{contact['id']}",
+        json={"phone": "380507654321"},
+        headers=headers,
+    )
+
+    assert response.status_code == 201, response.text
+    assert response.json()["phone"] == "380507654321"
+    assert len(query_log) == 1, query_log
+
+
+async def test_update_avatar(client, query_log, monkeypatch):
+    contact = await signup(client)
+    headers = auth_headers(SIGNUP["email"])
+    await client.get("/api/contacts/me", headers=headers)
+    query_log.clear()
+
+    class FakeUploadService:
+        async def upload(self, file, contact_id):
+            return f"https://cdn.example.com/avatars/{contact_id}.jpg"
+
+    monkeypatch.setitem(
+        container.__dict__, "avatar_upload_service", FakeUploadService()
+    )
+    response = await client.patch(
+        "/api/contacts/avatar",
+        files={"file": ("avatar.png", b"not inspected", "image/png")},
+        headers=headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["avatar"].endswith(f"/{contact['id']}.jpg")
+    assert len(query_log) == 1, query_log
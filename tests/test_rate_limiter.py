@@ -0,0 +1,109 @@
+import fakeredis
+import pytest
+import redis.asyncio
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.auth.login_guard import LoginGuard
+from src.auth.refresh_tokens import RefreshTokenStore
+from src.auth.tokens import (
+    REFRESH_TOKEN,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
+from src.config import settings
+from src.rate_limit.rate_limiter import RateLimiter, RateLimitError, client_key
+
+SHARED_STORAGE_URI = "async+redis://localhost:6379"
+
+
+def request_with(authorization: str | None = None) -> Request:
+    headers = []
+    if authorization is not None:
+        headers.append((b"authorization", authorization.encode()))
+    return Request(
+        {"type": "http", "headers": headers, "client": ("203.0.113.7", 50000)}
+    )
+
+
+def test_anonymous_requests_are_keyed_by_ip():
+    assert client_key(request_with()) == "ip:203.0.113.7"
+
+
+def test_verified_access_token_is_keyed_by_subject():
+    token = create_access_token({"sub": "ada@example.com"})
+
+    assert client_key(request_with(f"Bearer {token}")) == "user:ada@example.com"
+
+
+def test_unverified_tokens_fall_back_to_ip():
+    forged = create_access_token({"sub": "ada@example.com"})[:-4] + "AAAA"
+    expired = create_access_token({"sub": "ada@example.com"}, expires_delta=-60)
+    refresh = create_refresh_token({"sub": "ada@example.com"})
+
+    for token in ("random-value", forged, expired, refresh):
+        assert client_key(request_with(f"Bearer {token}")) == "ip:203.0.113.7"
+
+
+@pytest.fixture
+def shared_redis(monkeypatch):
+    """Every client built from a Redis URL talks to one in-memory fake server."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis.asyncio.Redis,
+        "from_url",
+        classmethod(
+            lambda cls, url, **options: fakeredis.FakeAsyncRedis(server=server)
+        ),
+    )
+    return server
+
+
+async def test_limit_is_shared_between_workers(shared_redis):
+    workers = [RateLimiter(SHARED_STORAGE_URI, {"login": "3/minute"}) for _ in range(2)]
+
+    for worker in (workers[0], workers[1], workers[0]):
+        await worker.check("login", "ip:203.0.113.7")
+
+    with pytest.raises(RateLimitError) as error:
+        await workers[1].check("login", "ip:203.0.113.7")
+
+    assert error.value.retry_after >= 1
+    assert workers[1].stats()["remote_checks"] == 2
+    await workers[1].check("login", "ip:198.51.100.1")
+
+
+async def test_local_window_rejects_without_a_remote_check(shared_redis):
+    worker = RateLimiter(SHARED_STORAGE_URI, {"login": "1/minute"})
+    await worker.check("login", "ip:203.0.113.7")
+
+    with pytest.raises(RateLimitError):
+        await worker.check("login", "ip:203.0.113.7")
+
+    assert worker.stats() == {
+        "remote_checks": 1,
+        "local_rejections": 1,
+        "rejections": 1,
+    }
+
+
+async def test_login_guard_counts_failures_across_workers(shared_redis, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_MAX_ACCOUNT_FAILURES", 2)
+    first, second = LoginGuard(SHARED_STORAGE_URI), LoginGuard(SHARED_STORAGE_URI)
+
+    await first.record_failure("ada@example.com", "203.0.113.7")
+    await second.record_failure("ada@example.com", "198.51.100.1")
+
+    with pytest.raises(HTTPException) as error:
+        await first.ensure_allowed("ada@example.com", "192.0.2.1")
+    assert error.value.status_code == 429
+
+
+async def test_refresh_token_reuse_is_seen_by_other_workers(shared_redis):
+    payload = decode_token(
+        create_refresh_token({"sub": "ada@example.com"}), REFRESH_TOKEN
+    )
+
+    assert await RefreshTokenStore(SHARED_STORAGE_URI).consume(payload)
+    assert not await RefreshTokenStore(SHARED_STORAGE_URI).consume(payload)
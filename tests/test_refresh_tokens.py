@@ -0,0 +1,48 @@
+from src.auth.refresh_tokens import RefreshTokenStore
+from src.auth.tokens import REFRESH_TOKEN, create_refresh_token, decode_token
+from tests.test_query_counts import SIGNUP, signup, verification_token
+
+
+def refresh_payload() -> dict:
+    return decode_token(create_refresh_token({"sub": "ada@example.com"}), REFRESH_TOKEN)
+
+
+async def test_refresh_token_is_single_use():
+    store = RefreshTokenStore("async+memory://")
+    payload = refresh_payload()
+
+    assert await store.consume(payload)
+    assert not await store.consume(payload)
+    assert store.stats() == {"reuse_rejections": 1}
+
+
+async def test_revoked_refresh_token_cannot_be_used():
+    store = RefreshTokenStore("async+memory://")
+    revoked, other = refresh_payload(), refresh_payload()
+
+    await store.revoke(revoked)
+
+    assert not await store.consume(revoked)
+    assert await store.consume(other)
+
+
+async def test_refresh_rotates_and_logout_revokes(client, database):
+    await signup(client)
+    await client.get(f"/api/auth/verify/{await verification_token(database)}")
+    login = await client.post(
+        "/api/auth/login",
+        json={"email": SIGNUP["email"], "password": SIGNUP["password"]},
+    )
+    first = login.json()["refresh_token"]
+
+    rotated = await client.post("/api/auth/refresh", json={"refresh_token": first})
+    assert rotated.status_code == 200, rotated.text
+    second = rotated.json()["refresh_token"]
+
+    replayed = await client.post("/api/auth/refresh", json={"refresh_token": first})
+    assert replayed.status_code == 401
+
+    logout = await client.post("/api/auth/logout", json={"refresh_token": second})
+    assert logout.status_code == 204
+    revoked = await client.post("/api/auth/refresh", json={"refresh_token": second})
+    assert revoked.status_code == 401
@@ -0,0 +1,118 @@
+import time
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.cache import response_cache as response_cache_module
+from src.cache.response_cache import (
+    InMemoryVersionStore,
+    ResponseCache,
+    ResponseCacheMiddleware,
+)
+from src.config import settings
+from src.database.db import ReplicaSessionManager, primary_reads
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache(InMemoryVersionStore(), max_entries=16)
+    monkeypatch.setattr(response_cache_module, "response_cache", cache)
+    return cache
+
+
+@pytest.fixture
+async def client(cache):
+    app = FastAPI()
+    app.add_middleware(ResponseCacheMiddleware)
+    app.state.reads = 0
+
+    @app.get("/api/contacts/{contact_id}")
+    async def read(contact_id: int):
+        app.state.reads += 1
+        return {"primary": primary_reads.get(), "read": app.state.reads}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        yield client
+
+
+async def test_fills_from_primary_right_after_a_write(client, cache):
+    await cache.invalidate()
+
+    response = await client.get("/api/contacts/1")
+
+    assert response.json()["primary"] is True
+    assert primary_reads.get() is False
+
+
+async def test_fills_from_replicas_once_the_window_has_passed(client, cache):
+    await cache.version_store.bump(
+        datetime.now(UTC)
+        - timedelta(seconds=settings.RESPONSE_CACHE_PRIMARY_WINDOW_SECONDS + 1)
+    )
+
+    response = await client.get("/api/contacts/2")
+
+    assert response.json()["primary"] is False
+
+
+async def test_revalidation_with_etag_and_last_modified(client, cache):
+    first = await client.get("/api/contacts/3")
+    etag, last_modified = first.headers["etag"], first.headers["last-modified"]
+
+    by_etag = await client.get("/api/contacts/3", headers={"If-None-Match": etag})
+    by_date = await client.get(
+        "/api/contacts/3", headers={"If-Modified-Since": last_modified}
+    )
+    other = await client.get("/api/contacts/3", headers={"If-None-Match": '"other"'})
+
+    assert (by_etag.status_code, by_etag.content) == (304, b"")
+    assert by_etag.headers["etag"] == etag
+    assert by_date.status_code == 304
+    assert other.status_code == 200
+    assert other.json() == first.json()
+    assert cache.stats()["not_modified"] == 2
+
+
+async def test_write_changes_the_etag(client, cache):
+    etag = (await client.get("/api/contacts/4")).headers["etag"]
+
+    await cache.invalidate()
+    response = await client.get("/api/contacts/4", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+async def test_local_entries_expire_after_max_age(client, cache, monkeypatch):
+    monkeypatch.setattr(cache, "max_age", 60)
+    first = await client.get("/api/contacts/5")
+    assert (await client.get("/api/contacts/5")).json() == first.json()
+
+    # Another worker's write is invisible here; only the age bound expires it.
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert (await client.get("/api/contacts/5")).json()["read"] == 2
+
+
+class FakeSessionManager:
+    def __init__(self, name: str):
+        self.name = name
+
+    def session_maker(self):
+        return self.name
+
+
+async def test_replica_manager_honours_primary_reads():
+    manager = ReplicaSessionManager(
+        FakeSessionManager("primary"), [FakeSessionManager("replica")], 30
+    )
+
+    token = primary_reads.set(True)
+    try:
+        assert await manager._open_session() == "primary"
+    finally:
+        primary_reads.reset(token)
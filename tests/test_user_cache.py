@@ -0,0 +1,77 @@
+from datetime import date
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from src.auth.user_cache import InMemoryCacheBackend, RedisCacheBackend, UserCache
+from src.database.models.contacts_model import Contact
+
+
+def make_contact(**overrides) -> Contact:
+    values = {
+        "id": 1,
+        "first_name": "Anna",
+        "last_name": "Melnyk",
+        "email": "anna@example.com",
+        "phone": "380000000001",
+        "birth_day": date(1990, 5, 17),
+        "data": {"company": "Acme"},
+        "password": "hash",
+        "verified": True,
+    }
+    values.update(overrides)
+    return Contact(**values)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        backend = InMemoryCacheBackend(max_size=10)
+    else:
+        backend = RedisCacheBackend(FakeAsyncRedis())
+
+    return UserCache(backend, ttl=60)
+
+
+async def test_get_returns_cached_contact(cache):
+    await cache.set("anna@example.com", make_contact())
+
+    contact = await cache.get("anna@example.com")
+
+    assert contact.id == 1
+    assert contact.birth_day == date(1990, 5, 17)
+    assert contact.data == {"company": "Acme"}
+    assert cache.stats() == {"hits": 1, "misses": 0}
+
+
+async def test_password_is_never_cached(cache):
+    await cache.set("anna@example.com", make_contact())
+
+    contact = await cache.get("anna@example.com")
+
+    assert contact.password is None
+
+
+async def test_miss_is_counted(cache):
+    assert await cache.get("nobody@example.com") is None
+    assert cache.stats() == {"hits": 0, "misses": 1}
+
+
+async def test_invalidate_removes_entry(cache):
+    await cache.set("anna@example.com", make_contact())
+
+    await cache.invalidate("anna@example.com")
+
+    assert await cache.get("anna@example.com") is None
+
+
+async def test_memory_backend_evicts_least_recently_used():
+    cache = UserCache(InMemoryCacheBackend(max_size=2), ttl=60)
+    await cache.set("a@example.com", make_contact(email="a@example.com"))
+    await cache.set("b@example.com", make_contact(email="b@example.com"))
+    await cache.get("a@example.com")
+
+    await cache.set("c@example.com", make_contact(email="c@example.com"))
+
+    assert await cache.get("b@example.com") is None
+    assert await cache.get("a@example.com") is not None